@@ -6,6 +6,18 @@ from typing import Dict, Any, Optional
 from packages.Logging import CloudLogger
 from packages.SecretAccessor import SecretAccessor
 
+# CORS responses, built once at import instead of per request
+_CORS_PREFLIGHT = ('', 204, {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Max-Age': '3600'
+})
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Content-Type': 'application/json'
+}
+
 
 class NotionGitHubSync:
     """Cloud Function to sync Notion pages with GitHub pull requests."""
@@ -336,18 +348,9 @@ def notion_github_sync(request):
     """
     # Set CORS headers for web requests
     if request.method == 'OPTIONS':
-        headers = {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'POST',
-            'Access-Control-Allow-Headers': 'Content-Type',
-            'Access-Control-Max-Age': '3600'
-        }
-        return ('', 204, headers)
+        return _CORS_PREFLIGHT
     
-    headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Content-Type': 'application/json'
-    }
+    headers = _CORS_HEADERS
     
     try:
         # Validate request method
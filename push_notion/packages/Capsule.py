@@ -88,7 +88,10 @@ class CapsuleNotion:
         #TaskConfig.servive_account = "sa_keys/puppy-executor-key.json"
         config = TaskConfig()
         config.queue = 'notion-queue'
-        response = Tasks(config).add_task(self.capsule, task_name=self.task_name)
+        tasks = Tasks(config)
+        response = tasks.add_task(self.capsule, task_name=self.task_name)
+        # Persist the PENDING status before the invocation can be frozen
+        tasks.flush_task_statuses()
         return response
 
     def run(self):
@@ -1,6 +1,43 @@
 from google.cloud import logging as cloud_logging
 import logging  # Import standard Python logging module
 import json
+import threading
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), default=str)
+
+# Key file of the service account the logs are written as
+SERVICE_ACCOUNT_FILE = 'sa_keys/puppy-logging-key.json'
+
+# Cloud Logging client shared by every CloudLogger in the process
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client():
+    """Return the process-wide Cloud Logging client, creating it on first use.
+    
+    The service account key is read and the Cloud Logging handler installed
+    only once, so additional CloudLogger instances (MemoryBank, Tasks, ...)
+    neither repeat that work nor attach duplicate handlers to the root
+    logger, which would emit every record several times.
+    
+    Returns:
+        cloud_logging.Client: The shared client
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            client = cloud_logging.Client.from_service_account_json(SERVICE_ACCOUNT_FILE)
+            client.setup_logging()
+            _CLIENT = client
+        return _CLIENT
 
 
 class CloudLogger(object):
@@ -11,10 +48,9 @@ class CloudLogger(object):
             logger_name (str): Name of the logger
             prefix (str, optional): Prefix to add to all log messages
         """
-        # Set up Google Cloud Logging with credentials
-        self.service_account = 'sa_keys/puppy-logging-key.json'
-        self.cloud_logging_client = cloud_logging.Client.from_service_account_json(self.service_account)
-        self.cloud_logging_client.setup_logging()
+        # Share a single Google Cloud Logging client across instances
+        self.service_account = SERVICE_ACCOUNT_FILE
+        self.cloud_logging_client = _get_client()
 
         # Set up Python logger
         self.logger = logging.getLogger(logger_name)
@@ -39,22 +75,30 @@ class CloudLogger(object):
            
         if extra:
             # Convert extra dict to JSON string and append to message
-            extra_str = json.dumps(extra)
+            extra_str = _dumps(extra)
             return f"{msg} | Extra: {extra_str}"
         return msg
 
     def info(self, msg, extra=None):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.info(formatted_msg)
 
     def warning(self, msg, extra=None):
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.warning(formatted_msg)
 
     def error(self, msg, extra=None):
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.error(formatted_msg)
 
     def debug(self, msg, extra=None):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.debug(formatted_msg)
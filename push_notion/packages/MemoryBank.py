@@ -6,166 +6,385 @@ This module provides functionality to:
 2. Maintain sync status
 3. Log errors and resolutions
 4. Cache configurations
+
+State is kept in a single SQLite database (memory-bank/mb.sqlite) with one
+table per entity, so every update is a single INSERT/UPDATE on a persistent
+connection instead of a full JSON file rewrite. The legacy JSON files can
+still be produced on demand with `export_json`.
 """
 
 import json
 import os
+import sqlite3
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from packages.Logging import CloudLogger
 
+_utcnow = datetime.utcnow
+
+# Reads are served straight from a memory map of mb.sqlite up to this size,
+# skipping the copy from the page cache into SQLite's own buffers.
+MMAP_SIZE = 64 * 1024 * 1024
+
+# sync_history and errors keep at most HISTORY_LIMIT rows; once full, the
+# oldest ARCHIVE_CHUNK rows are moved to a dated NDJSON archive file.
+HISTORY_LIMIT = 1000
+ARCHIVE_CHUNK = 500
+
+DEFAULT_CONFIG = {
+    "notion_settings": {
+        "api_version": "2022-06-28",
+        "retry_attempts": 3,
+        "timeout_seconds": 30
+    },
+    "logging_settings": {
+        "log_level": "INFO",
+        "structured_logging": True
+    },
+    "cache_settings": {
+        "ttl_seconds": 3600,
+        "max_entries": 1000
+    },
+    "last_config_update": None
+}
+
+DEFAULT_META = {
+    "current_status": "initialized",
+    "last_successful_sync": None,
+    "last_updated": None,
+    "success_count": 0,
+    "error_count": 0,
+    "resolved_errors": 0
+}
+
+def _sync_entry(ts, status, error) -> Dict:
+    return {'timestamp': ts, 'status': status, 'error': error}
+
+def _error_entry(ts, error_type, message) -> Dict:
+    return {'timestamp': ts, 'error_type': error_type, 'message': message}
+
 class MemoryBank:
     """Manages persistent storage for Push Notion operations."""
-    
+
     def __init__(self):
         """Initialize the memory bank."""
         self.logger = CloudLogger(logger_name='Memory_Bank')
         self.base_path = 'memory-bank'
+        self.db_path = os.path.join(self.base_path, 'mb.sqlite')
         self._ensure_directory()
-        self._initialize_files()
-    
+        first_run = not os.path.exists(self.db_path)
+        self._connect()
+        if first_run:
+            self._initialize_tables()
+        self._load_caches()
+
     def _ensure_directory(self):
         """Ensure memory bank directory exists."""
         if not os.path.exists(self.base_path):
             os.makedirs(self.base_path)
-    
-    def _initialize_files(self):
-        """Initialize memory bank files with default structures."""
-        self._write_json('notion_pages.json', {
-            "pages": {},
-            "last_updated": None,
-            "metadata": {
-                "total_pages": 0,
-                "last_sync": None
-            }
-        })
-        
-        self._write_json('sync_status.json', {
-            "last_successful_sync": None,
-            "sync_history": [],
-            "current_status": "initialized",
-            "error_count": 0,
-            "success_count": 0
-        })
-        
-        self._write_json('error_log.json', {
-            "errors": [],
-            "patterns": {},
-            "resolutions": {},
-            "last_error": None,
-            "error_stats": {
-                "total_errors": 0,
-                "resolved_errors": 0
-            }
-        })
-        
-        self._write_json('config_cache.json', {
-            "notion_settings": {
-                "api_version": "2022-06-28",
-                "retry_attempts": 3,
-                "timeout_seconds": 30
-            },
-            "logging_settings": {
-                "log_level": "INFO",
-                "structured_logging": True
-            },
-            "cache_settings": {
-                "ttl_seconds": 3600,
-                "max_entries": 1000
-            },
-            "last_config_update": None
-        })
-    
+
+    def _connect(self):
+        """Open the persistent SQLite connection used by every operation."""
+        self.db = sqlite3.connect(self.db_path, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        # Tracking data is recoverable from Notion/Firestore, so commits are
+        # never fsynced; a crash can at worst lose the last few writes.
+        self.db.execute('PRAGMA synchronous=OFF')
+        self.db.execute(f'PRAGMA mmap_size={MMAP_SIZE}')
+
+    def _initialize_tables(self):
+        """Create memory bank tables and seed the default configuration.
+
+        Runs as a single transaction and only on first run; an existing
+        database is left untouched so accumulated history is preserved.
+        """
+        self.db.executescript("""
+            BEGIN;
+            CREATE TABLE IF NOT EXISTS pages (
+                page_id TEXT PRIMARY KEY,
+                data TEXT,
+                updated_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS sync_history (
+                ts TEXT,
+                status TEXT,
+                error TEXT
+            );
+            CREATE TABLE IF NOT EXISTS errors (
+                ts TEXT,
+                type TEXT,
+                message TEXT
+            );
+            CREATE TABLE IF NOT EXISTS error_patterns (
+                type TEXT PRIMARY KEY,
+                count INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS config (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value
+            );
+        """)
+
+        self.db.executemany(
+            'INSERT OR IGNORE INTO config (key, value) VALUES (?, ?)',
+            [(key, json.dumps(value)) for key, value in DEFAULT_CONFIG.items()]
+        )
+        self.db.executemany(
+            'INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)',
+            list(DEFAULT_META.items())
+        )
+        self.db.execute('COMMIT')
+
+    def _load_caches(self):
+        """Load config and error counters once so reads never hit the database."""
+        self._config = {
+            key: json.loads(value)
+            for key, value in self.db.execute('SELECT key, value FROM config')
+        }
+        self._error_patterns = Counter(
+            dict(self.db.execute('SELECT type, count FROM error_patterns'))
+        )
+        self._resolved_errors = self.db.execute(
+            "SELECT value FROM meta WHERE key = 'resolved_errors'"
+        ).fetchone()[0]
+        self._history_sizes = {
+            table: self.db.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table in ('sync_history', 'errors')
+        }
+
+    def _trim_history(self, table: str, to_entry):
+        """Keep a history table bounded by archiving its oldest rows.
+
+        Once the table reaches HISTORY_LIMIT rows, the oldest ARCHIVE_CHUNK
+        rows are appended to `<table>.archive.<date>.ndjson` and deleted, so
+        the live table never grows without bound.
+        """
+        self._history_sizes[table] += 1
+        if self._history_sizes[table] < HISTORY_LIMIT:
+            return
+
+        rows = self.db.execute(
+            f'SELECT rowid, * FROM {table} ORDER BY rowid LIMIT ?', (ARCHIVE_CHUNK,)
+        ).fetchall()
+        archive_name = f"{table}.archive.{_utcnow().date().isoformat()}.ndjson"
+        with open(os.path.join(self.base_path, archive_name), 'a') as f:
+            f.write(''.join(
+                json.dumps(to_entry(*row[1:]), separators=(',', ':')) + '\n'
+                for row in rows
+            ))
+        self.db.execute(f'DELETE FROM {table} WHERE rowid <= ?', (rows[-1][0],))
+        self._history_sizes[table] -= len(rows)
+
+    @contextmanager
+    def buffered(self):
+        """Group every write made inside the block into a single commit.
+
+        Each operation otherwise commits on its own; in a sync loop that
+        updates many pages back-to-back this defers persistence to one
+        flush on exit. If the block raises, everything written inside it is
+        rolled back. Nested blocks join the outermost one, which alone
+        commits or rolls back.
+
+        Example:
+            with memory_bank.buffered():
+                for page_id, data in pages.items():
+                    memory_bank.update_page(page_id, data)
+        """
+        if self.db.in_transaction:
+            yield self
+            return
+        self.db.execute('BEGIN')
+        try:
+            yield self
+        except BaseException:
+            self.db.execute('ROLLBACK')
+            # Drop cached config/counters updated by the rolled-back writes
+            self._load_caches()
+            raise
+        else:
+            self.db.execute('COMMIT')
+
+    def _set_meta(self, key: str, value: Any):
+        """Set a single scalar in the meta table."""
+        self.db.execute(
+            'INSERT INTO meta (key, value) VALUES (?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+            (key, value)
+        )
+
+    def _increment_meta(self, key: str):
+        """Increment an integer counter in the meta table."""
+        self.db.execute(
+            'INSERT INTO meta (key, value) VALUES (?, 1) '
+            'ON CONFLICT(key) DO UPDATE SET value = value + 1',
+            (key,)
+        )
+
+    def _get_meta(self) -> Dict[str, Any]:
+        """Read the whole meta table as a dict."""
+        return dict(self.db.execute('SELECT key, value FROM meta'))
+
     def _write_json(self, filename: str, data: Dict):
-        """Write data to a JSON file."""
+        """Write data to a JSON file as compact JSON in a single write.
+
+        Non-durable by design: no fsync and no atomic rename, the file is only
+        a convenience copy of data held in the database.
+        """
+        payload = json.dumps(data, separators=(',', ':'))
         filepath = os.path.join(self.base_path, filename)
         with open(filepath, 'w') as f:
-            json.dump(data, f, indent=4)
-    
-    def _read_json(self, filename: str) -> Dict:
-        """Read data from a JSON file."""
+            f.write(payload)
+
+    def _write_json_pretty(self, filename: str, data: Dict):
+        """Write data to a human-readable, indented JSON file (non-durable)."""
+        payload = json.dumps(data, indent=4)
         filepath = os.path.join(self.base_path, filename)
-        try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            self.logger.error(f"File not found: {filename}")
-            return {}
-    
+        with open(filepath, 'w') as f:
+            f.write(payload)
+
     def update_page(self, page_id: str, data: Dict):
         """Update or create a page entry."""
-        pages = self._read_json('notion_pages.json')
-        pages['pages'][page_id] = {
-            **data,
-            'last_updated': datetime.now().isoformat()
-        }
-        pages['last_updated'] = datetime.now().isoformat()
-        pages['metadata']['total_pages'] = len(pages['pages'])
-        self._write_json('notion_pages.json', pages)
-    
+        now = _utcnow().isoformat()
+        with self.buffered():
+            self.db.execute(
+                'INSERT OR REPLACE INTO pages (page_id, data, updated_at) VALUES (?, ?, ?)',
+                (page_id, json.dumps(data), now)
+            )
+            self._set_meta('last_updated', now)
+
     def update_sync_status(self, status: str, error: Optional[str] = None):
         """Update sync status and history."""
-        sync_data = self._read_json('sync_status.json')
-        sync_data['current_status'] = status
-        sync_data['last_successful_sync'] = (
-            datetime.now().isoformat() if status == 'completed' 
-            else sync_data['last_successful_sync']
-        )
-        
-        sync_data['sync_history'].append({
-            'timestamp': datetime.now().isoformat(),
-            'status': status,
-            'error': error
-        })
-        
-        if status == 'completed':
-            sync_data['success_count'] += 1
-        elif status == 'failed':
-            sync_data['error_count'] += 1
-            
-        self._write_json('sync_status.json', sync_data)
-    
+        now = _utcnow().isoformat()
+        with self.buffered():
+            self.db.execute(
+                'INSERT INTO sync_history (ts, status, error) VALUES (?, ?, ?)',
+                (now, status, error)
+            )
+            self._trim_history('sync_history', _sync_entry)
+            self._set_meta('current_status', status)
+
+            if status == 'completed':
+                self._set_meta('last_successful_sync', now)
+                self._increment_meta('success_count')
+            elif status == 'failed':
+                self._increment_meta('error_count')
+
     def log_error(self, error: Exception):
         """Log an error and update error statistics."""
-        error_data = self._read_json('error_log.json')
-        error_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'error_type': type(error).__name__,
-            'message': str(error)
-        }
-        
-        error_data['errors'].append(error_entry)
-        error_data['last_error'] = error_entry
-        error_data['error_stats']['total_errors'] += 1
-        
-        # Update error patterns
         error_type = type(error).__name__
-        if error_type not in error_data['patterns']:
-            error_data['patterns'][error_type] = 0
-        error_data['patterns'][error_type] += 1
-        
-        self._write_json('error_log.json', error_data)
-    
+        with self.buffered():
+            self.db.execute(
+                'INSERT INTO errors (ts, type, message) VALUES (?, ?, ?)',
+                (_utcnow().isoformat(), error_type, str(error))
+            )
+            self._trim_history('errors', _error_entry)
+
+            # Update error patterns
+            self.db.execute(
+                'INSERT INTO error_patterns (type, count) VALUES (?, 1) '
+                'ON CONFLICT(type) DO UPDATE SET count = count + 1',
+                (error_type,)
+            )
+        self._error_patterns[error_type] += 1
+
     def update_config(self, config: Dict):
         """Update configuration cache."""
-        config_data = self._read_json('config_cache.json')
-        config_data.update(config)
-        config_data['last_config_update'] = datetime.now().isoformat()
-        self._write_json('config_cache.json', config_data)
-    
+        config = {**config, 'last_config_update': _utcnow().isoformat()}
+        with self.buffered():
+            self.db.executemany(
+                'INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)',
+                [(key, json.dumps(value)) for key, value in config.items()]
+            )
+            self._config.update(config)
+
     def get_config(self) -> Dict:
         """Get current configuration."""
-        return self._read_json('config_cache.json')
-    
+        return dict(self._config)
+
     def get_page(self, page_id: str) -> Optional[Dict]:
         """Get page data by ID."""
-        pages = self._read_json('notion_pages.json')
-        return pages['pages'].get(page_id)
-    
+        row = self.db.execute(
+            'SELECT data, updated_at FROM pages WHERE page_id = ?', (page_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {**json.loads(row[0]), 'last_updated': row[1]}
+
+    def read_sync_history(self) -> Iterator[Dict]:
+        """Lazily yield sync history entries, oldest first."""
+        for row in self.db.execute(
+            'SELECT ts, status, error FROM sync_history ORDER BY rowid'
+        ):
+            yield _sync_entry(*row)
+
+    def read_errors(self) -> Iterator[Dict]:
+        """Lazily yield logged errors, oldest first."""
+        for row in self.db.execute(
+            'SELECT ts, type, message FROM errors ORDER BY rowid'
+        ):
+            yield _error_entry(*row)
+
     def get_sync_status(self) -> Dict:
         """Get current sync status."""
-        return self._read_json('sync_status.json')
-    
+        meta = self._get_meta()
+        return {
+            "last_successful_sync": meta['last_successful_sync'],
+            "sync_history": list(self.read_sync_history()),
+            "current_status": meta['current_status'],
+            "error_count": meta['error_count'],
+            "success_count": meta['success_count']
+        }
+
     def get_error_stats(self) -> Dict:
         """Get error statistics."""
-        return self._read_json('error_log.json')['error_stats'] 
\ No newline at end of file
+        return {
+            "total_errors": sum(self._error_patterns.values()),
+            "resolved_errors": self._resolved_errors
+        }
+
+    def export_json(self, pretty: bool = True):
+        """Export the memory bank to the legacy JSON files on demand.
+
+        Args:
+            pretty (bool): Indent the files for humans; pass False for
+                compact output.
+        """
+        write_json = self._write_json_pretty if pretty else self._write_json
+        meta = self._get_meta()
+        pages = {
+            page_id: {**json.loads(data), 'last_updated': updated_at}
+            for page_id, data, updated_at in self.db.execute(
+                'SELECT page_id, data, updated_at FROM pages'
+            )
+        }
+        write_json('notion_pages.json', {
+            "pages": pages,
+            "last_updated": meta['last_updated'],
+            "metadata": {
+                "total_pages": len(pages),
+                "last_sync": meta['last_successful_sync']
+            }
+        })
+
+        write_json('sync_status.json', self.get_sync_status())
+
+        errors = list(self.read_errors())
+        write_json('error_log.json', {
+            "errors": errors,
+            "patterns": dict(self._error_patterns),
+            "resolutions": {},
+            "last_error": errors[-1] if errors else None,
+            "error_stats": self.get_error_stats()
+        })
+
+        write_json('config_cache.json', self.get_config())
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        self.db.close()
@@ -1,15 +1,84 @@
 import json
+import logging
 from google.cloud import tasks_v2
 from google.oauth2 import service_account
 from google.cloud import firestore
+from google.api_core.exceptions import AlreadyExists
 from packages.Logging import CloudLogger
 from packages.Firestore import Firestore
-from typing import Dict, Optional, Union, List
+from typing import Dict, Optional, Union, List, Tuple
 from dataclasses import dataclass
+import atexit
 import os
+import threading
+from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 
+# Maximum number of writes Firestore accepts in a single WriteBatch
+FIRESTORE_BATCH_LIMIT = 500
+
+# Number of Cloud Tasks create calls add_tasks_batch keeps in flight
+BATCH_MAX_WORKERS = 32
+
+# Task statuses of every Tasks instance go through one queue, written by a
+# single background worker per process; items are (owner, entry) pairs
+_STATUS_QUEUE = Queue()
+_STATUS_LOCK = threading.Lock()
+_STATUS_WORKER = None
+
+# Queued after the last item to make the worker exit
+_STOP = object()
+
+
+def _write_task_statuses(items: List) -> None:
+    """Store a drained run of queued statuses, grouped by owning instance."""
+    by_owner = {}
+    for owner, entry in items:
+        by_owner.setdefault(id(owner), (owner, []))[1].append(entry)
+    for owner, entries in by_owner.values():
+        try:
+            owner._store_task_statuses(entries)
+        except Exception:
+            # Already logged; the tasks themselves were created successfully
+            pass
+
+
+def _drain_task_statuses() -> None:
+    """Write queued task statuses to Firestore in batches until stopped."""
+    while True:
+        items = [_STATUS_QUEUE.get()]
+        while len(items) < FIRESTORE_BATCH_LIMIT and items[-1] is not _STOP:
+            try:
+                items.append(_STATUS_QUEUE.get_nowait())
+            except Empty:
+                break
+        stop = items[-1] is _STOP
+        try:
+            _write_task_statuses([item for item in items if item is not _STOP])
+        finally:
+            for _ in range(len(items)):
+                _STATUS_QUEUE.task_done()
+        # Don't hold the written owners while blocked on the next get
+        items = None
+        if stop:
+            return
+
+
+def _stop_status_worker() -> None:
+    """Write out every queued status, then stop the worker thread."""
+    global _STATUS_WORKER
+    with _STATUS_LOCK:
+        worker, _STATUS_WORKER = _STATUS_WORKER, None
+        if worker is not None:
+            _STATUS_QUEUE.put(_STOP)
+    if worker is not None:
+        worker.join()
+
+
+atexit.register(_stop_status_worker)
+
 class TaskStatus(Enum):
     """Enumeration of possible task execution states.
     
@@ -124,10 +193,55 @@ class Tasks(object):
         """Initialize the Firestore client."""
         try:
             self.db = Firestore('system').client_firestore
+            self._collection = self.db.collection(self.config.firestore_collection)
         except Exception as e:
             self.logging.error(f"Failed to initialize Firestore client: {e}")
             raise
     
+    def _build_task_status(self, task_name: str, url: str, payload: Dict, queue: str, status: TaskStatus = TaskStatus.PENDING) -> Tuple[str, Dict]:
+        """Build the Firestore document ID and body for a task status entry.
+        
+        Args:
+            task_name (str): Unique identifier of the task
+            url (str): Target URL for the task
+            payload (Dict): Task payload data
+            queue (str): Name of the queue the task belongs to
+            status (TaskStatus): Initial status of the task, defaults to PENDING
+            
+        Returns:
+            Tuple[str, Dict]: The document ID and the document body
+            
+        Raises:
+            ValueError: If task_name is empty or invalid
+        """
+        if not task_name or not isinstance(task_name, str):
+            raise ValueError("task_name must be a non-empty string")
+            
+        # Clean and validate task name
+        task_name = task_name.strip()
+        if not task_name:
+            raise ValueError("task_name cannot be empty after stripping")
+            
+        # Extract the last part of the task name if it's a full path
+        if '/' in task_name:
+            task_name = task_name.split('/')[-1]
+        
+        # Let Firestore stamp the write instead of building a datetime client-side
+        now = firestore.SERVER_TIMESTAMP
+        
+        # Same fields as TaskStatusInfo, built directly for Firestore storage
+        task_dict = {
+            "task_name": task_name,
+            "status": status.value,
+            "created_at": now,
+            "updated_at": now,
+            "url": url,
+            "payload": payload,
+            "queue_name": queue,
+            "error": None
+        }
+        return task_name, task_dict
+    
     def _store_task_status(self, task_name: str, url: str, payload: Dict, queue: str, status: TaskStatus = TaskStatus.PENDING) -> None:
         """Store task status in Firestore.
         
@@ -146,61 +260,180 @@ class Tasks(object):
             ValueError: If task_name is empty or invalid
             Exception: If Firestore operation fails
         """
-        if not task_name or not isinstance(task_name, str):
-            raise ValueError("task_name must be a non-empty string")
+        try:
+            document_id, task_dict = self._build_task_status(task_name, url, payload, queue, status)
+            self._collection.document(document_id).set(task_dict, merge=True)
+        except Exception as e:
+            error_msg = f"Failed to store task status: {str(e)}"
+            self.logging.error(error_msg)
+            raise ValueError(error_msg)
+    
+    def _store_task_statuses(self, entries: List[Tuple[str, str, Dict, str]]) -> None:
+        """Store many task statuses with batched Firestore writes.
+        
+        Documents are written through a WriteBatch committed every
+        FIRESTORE_BATCH_LIMIT entries, so N tasks cost ceil(N/500) round
+        trips instead of N.
+        
+        The writes are create-only: a worker may already have recorded
+        RUNNING or COMPLETED through update_task_status by the time this
+        runs, and that status must not be reset to PENDING. If a batch hits
+        an existing document, its entries are created one by one and the
+        existing documents are left as they are.
+        
+        Args:
+            entries (List[Tuple[str, str, Dict, str]]): (task_name, url, payload, queue)
+                tuples, one per task to track
             
+        Raises:
+            ValueError: If a task name is invalid or a batch commit fails
+        """
         try:
-            # Clean and validate task name
-            task_name = task_name.strip()
-            if not task_name:
-                raise ValueError("task_name cannot be empty after stripping")
-                
-            # Extract the last part of the task name if it's a full path
-            if '/' in task_name:
-                task_name = task_name.split('/')[-1]
+            for start in range(0, len(entries), FIRESTORE_BATCH_LIMIT):
+                documents = [
+                    self._build_task_status(*entry)
+                    for entry in entries[start:start + FIRESTORE_BATCH_LIMIT]
+                ]
+                batch = self.db.batch()
+                for document_id, task_dict in documents:
+                    batch.create(self._collection.document(document_id), task_dict)
+                try:
+                    batch.commit()
+                except AlreadyExists:
+                    # The batch is atomic, so nothing was written; retry per document
+                    for document_id, task_dict in documents:
+                        try:
+                            self._collection.document(document_id).create(task_dict)
+                        except AlreadyExists:
+                            pass
+        except Exception as e:
+            error_msg = f"Failed to store task statuses: {str(e)}"
+            self.logging.error(error_msg)
+            raise ValueError(error_msg)
+    
+    def _enqueue_task_status(self, task_name: str, url: str, payload: Dict, queue: str) -> None:
+        """Queue a task status for the background writer and return immediately.
+        
+        The status write is not needed for the task to run, so it is kept off
+        the enqueue path. The process-wide worker drains up to
+        FIRESTORE_BATCH_LIMIT queued statuses per WriteBatch; it holds a
+        reference to this instance only until its statuses are written.
+        
+        Args:
+            task_name (str): Unique identifier of the task
+            url (str): Target URL for the task
+            payload (Dict): Task payload data
+            queue (str): Name of the queue the task belongs to
+        """
+        global _STATUS_WORKER
+        with _STATUS_LOCK:
+            if _STATUS_WORKER is None:
+                _STATUS_WORKER = threading.Thread(
+                    target=_drain_task_statuses,
+                    name="task-status-writer",
+                    daemon=True
+                )
+                _STATUS_WORKER.start()
+            _STATUS_QUEUE.put((self, (task_name, url, payload, queue)))
+    
+    def flush_task_statuses(self) -> None:
+        """Block until every queued task status has been written to Firestore.
+        
+        Callers of add_task must call this before the process may be frozen
+        or shut down, e.g. before a Cloud Function returns its response;
+        statuses still queued at that point can be lost. add_tasks_batch
+        calls it itself.
+        """
+        _STATUS_QUEUE.join()
+    
+    def _create_task(self, params: Dict, task_name: Optional[str] = None) -> tasks_v2.Task:
+        """Create a task in Cloud Tasks without recording its status.
+        
+        Args:
+            params (Dict): Task parameters including:
+                - url (str): Target URL for the task (required)
+                - payload (Dict): Task payload (optional)
+                - queue (str): Queue name (optional, defaults to config queue)
+            task_name (Optional[str]): Custom name for the task. If not provided,
+                a name will be generated by Cloud Tasks.
+        
+        Returns:
+            tasks_v2.Task: The created task
             
-            now = datetime.utcnow()
-            task_info = TaskStatusInfo(
-                task_name=task_name,
-                status=status,
-                created_at=now,
-                updated_at=now,
-                url=url,
-                payload=payload,
-                queue_name=queue
-            )
+        Raises:
+            ValueError: If required parameters are missing or task creation fails
+        """
+        debug = self.logging.logger.isEnabledFor(logging.DEBUG)
+        
+        # Log input parameters for debugging
+        if debug:
+            self.logging.debug(f"Adding task with params: {json.dumps(params, default=str)}")
+        
+        # Validate URL
+        if not params.get("url"):
+            error_msg = "URL is required in params"
+            self.logging.error(error_msg)
+            raise ValueError(error_msg)
             
-            # Convert to dict for Firestore storage
-            task_dict = {
-                "task_name": task_info.task_name,
-                "status": task_info.status.value,
-                "created_at": task_info.created_at,
-                "updated_at": task_info.updated_at,
-                "url": task_info.url,
-                "payload": task_info.payload,
-                "queue_name": task_info.queue_name,
-                "error": task_info.error
+        url = params["url"]
+        payload = params.get("payload", {})
+        queue = params.get("queue", self.config.queue)
+        
+        # Validate client
+        if not hasattr(self, 'client') or not self.client:
+            error_msg = "Cloud Tasks client not initialized"
+            self.logging.error(error_msg)
+            raise ValueError(error_msg)
+        
+        try:
+            parent = self.client.queue_path(
+                self.config.project_id,
+                self.config.location,
+                queue
+            )
+        except Exception as e:
+            error_msg = f"Failed to create queue path: {str(e)}"
+            self.logging.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # Prepare task
+        task = {
+            "http_request": {
+                "http_method": tasks_v2.HttpMethod.POST,
+                "url": url,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps(payload).encode()
             }
-            
-            # Ensure collection path is valid
-            collection_ref = self.db.collection(self.config.firestore_collection)
-            if not collection_ref:
-                raise ValueError(f"Invalid collection path: {self.config.firestore_collection}")
-            
-            # Log the paths for debugging
-            self.logging.info(f"Collection path: {self.config.firestore_collection}")
-            self.logging.info(f"Document ID: {task_name}")
-            
-            # Create document with explicit path
-            doc_ref = collection_ref.document(task_name)
-            doc_ref.set(task_dict, merge=True)
-            
-            self.logging.info(f"Task status stored successfully: {task_name}")
-            
+        }
+        
+        # Add name if provided
+        if task_name:
+            task["name"] = f"{parent}/tasks/{task_name}"
+        
+        # Log task details
+        if debug:
+            self.logging.debug(f"Task details: {json.dumps(task, default=str)}")
+        
+        try:
+            response = self.client.create_task(
+                request={"parent": parent, "task": task}
+            )
         except Exception as e:
-            error_msg = f"Failed to store task status: {str(e)}"
+            error_msg = f"Failed to create task in Cloud Tasks: {str(e)}"
+            self.logging.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if not response:
+            error_msg = "No response received from create_task"
+            self.logging.error(error_msg)
+            raise ValueError(error_msg)
+            
+        if not response.name:
+            error_msg = "Task created but no name in response"
             self.logging.error(error_msg)
             raise ValueError(error_msg)
+        
+        return response
     
     def add_task(self, params: Dict, task_name: Optional[str] = None) -> Optional[str]:
         """Add a new task to the queue.
@@ -213,108 +446,32 @@ class Tasks(object):
             task_name (Optional[str]): Custom name for the task. If not provided,
                 a name will be generated by Cloud Tasks.
         
+        The task status is written in the background; call
+        flush_task_statuses before the invocation ends.
+        
         Returns:
             Optional[str]: Task name if successful, None if failed
-            
-        Raises:
-            ValueError: If required parameters are missing
-            Exception: If task creation or status storage fails
         """
         try:
-            # Log input parameters for debugging
-            self.logging.info(f"Adding task with params: {json.dumps(params, default=str)}")
-            if task_name:
-                self.logging.info(f"Using custom task name: {task_name}")
-            
-            # Validate URL
-            if not params.get("url"):
-                error_msg = "URL is required in params"
-                self.logging.error(error_msg)
-                raise ValueError(error_msg)
-                
-            url = params["url"]
-            payload = params.get("payload", {})
-            queue = params.get("queue", self.config.queue)
-            
-            # Log configuration
-            self.logging.info(f"Using queue: {queue}")
-            self.logging.info(f"Project ID: {self.config.project_id}")
-            self.logging.info(f"Location: {self.config.location}")
-            
-            # Validate client
-            if not hasattr(self, 'client') or not self.client:
-                error_msg = "Cloud Tasks client not initialized"
-                self.logging.error(error_msg)
-                raise ValueError(error_msg)
-            
-            try:
-                parent = self.client.queue_path(
-                    self.config.project_id,
-                    self.config.location,
-                    queue
-                )
-                self.logging.info(f"Queue path: {parent}")
-            except Exception as e:
-                error_msg = f"Failed to create queue path: {str(e)}"
-                self.logging.error(error_msg)
-                raise ValueError(error_msg)
-            
-            # Prepare task
-            task = {
-                "http_request": {
-                    "http_method": tasks_v2.HttpMethod.POST,
-                    "url": url,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": json.dumps(payload).encode()
-                }
-            }
-            
-            # Add name if provided
-            if task_name:
-                task["name"] = f"{parent}/tasks/{task_name}"
-            
-            # Log task details
-            self.logging.info(f"Task details: {json.dumps(task, default=str)}")
+            response = self._create_task(params, task_name)
             
-            try:
-                response = self.client.create_task(
-                    request={"parent": parent, "task": task}
-                )
-            except Exception as e:
-                error_msg = f"Failed to create task in Cloud Tasks: {str(e)}"
-                self.logging.error(error_msg)
-                raise ValueError(error_msg)
-            
-            if not response:
-                error_msg = "No response received from create_task"
-                self.logging.error(error_msg)
-                raise ValueError(error_msg)
-                
-            if not response.name:
-                error_msg = "Task created but no name in response"
-                self.logging.error(error_msg)
-                raise ValueError(error_msg)
-            
-            # Log successful task creation
-            self.logging.info(f"Task created successfully with name: {response.name}")
-            
-            try:
-                # Store task status in Firestore
-                self._store_task_status(response.name, url, payload, queue)
-                self.logging.info(f"Task status stored in Firestore: {response.name}")
-            except Exception as e:
-                error_msg = f"Failed to store task status: {str(e)}"
-                self.logging.error(error_msg)
-                # Don't raise here, as the task was created successfully
+            # Store task status in Firestore without waiting for the write
+            self._enqueue_task_status(
+                response.name,
+                params["url"],
+                params.get("payload", {}),
+                params.get("queue", self.config.queue)
+            )
             
-            self.logging.info(f"[enqueue_push_notion_task] Task enqueued: {response.name}")
-            print(f"[enqueue_push_notion_task] Task enqueued: {response.name}")
+            self.logging.info("Task enqueued", extra={
+                "queue": params.get("queue", self.config.queue),
+                "url": params["url"],
+                "name": response.name
+            })
             return response
             
         except Exception as e:
-            error_msg = f"Failed to add task: {str(e)}"
-            print(error_msg)
-            self.logging.error(error_msg)
+            self.logging.error(f"Failed to add task: {str(e)}")
             return None
     
     def update_task_status(self, task_name: str, status: TaskStatus, error: Optional[str] = None) -> None:
@@ -328,6 +485,8 @@ class Tasks(object):
         - When retrying failed tasks
         
         The status update includes a timestamp and optional error message.
+        It is merged into the document, creating it if the background PENDING
+        write has not landed yet; that write then leaves it untouched.
         
         Args:
             task_name (str): Unique identifier of the task to update
@@ -339,12 +498,12 @@ class Tasks(object):
             Exception: If the Firestore update fails
         """
         try:
-            task_ref = self.db.collection(self.config.firestore_collection).document(task_name)
-            task_ref.update({
+            task_ref = self._collection.document(task_name)
+            task_ref.set({
                 "status": status.value,
-                "updated_at": datetime.utcnow(),
+                "updated_at": firestore.SERVER_TIMESTAMP,
                 "error": error
-            })
+            }, merge=True)
         except Exception as e:
             self.logging.error(f"Failed to update task status: {e}")
             raise
@@ -352,6 +511,10 @@ class Tasks(object):
     def add_tasks_batch(self, tasks: List[Dict]) -> Dict[str, List]:
         """Add multiple tasks in batch.
         
+        Tasks are created concurrently on a thread pool; their statuses are
+        handed to the background writer, which stores them in batches, and
+        are flushed before returning.
+        
         Args:
             tasks (List[Dict]): List of task parameters, each containing:
                 - url (str): Target URL for the task (required)
@@ -363,24 +526,33 @@ class Tasks(object):
         """
         results = {"succeeded": [], "failed": []}
         
-        for task_params in tasks:
+        # Overlap the Cloud Tasks round trips; results are read back in input order
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            futures = [
+                (task_params, executor.submit(self._create_task, task_params))
+                for task_params in tasks
+            ]
+        
+        for task_params, future in futures:
             try:
-                task_name = self.add_task(task_params)
-                if task_name:
-                    results["succeeded"].append({
-                        "params": task_params,
-                        "task_name": task_name
-                    })
-                else:
-                    results["failed"].append({
-                        "params": task_params,
-                        "error": "Task creation failed"
-                    })
+                response = future.result()
+                results["succeeded"].append({
+                    "params": task_params,
+                    "task_name": response
+                })
+                self._enqueue_task_status(
+                    response.name,
+                    task_params["url"],
+                    task_params.get("payload", {}),
+                    task_params.get("queue", self.config.queue)
+                )
             except Exception as e:
+                self.logging.error(f"Failed to add task: {str(e)}")
                 results["failed"].append({
                     "params": task_params,
                     "error": str(e)
                 })
         
+        self.flush_task_statuses()
         return results
 
@@ -1,6 +1,12 @@
 import requests
 from web3 import Web3
+from web3.exceptions import Web3Exception
+from eth_abi.exceptions import DecodingError
 import json
+import functools
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 
 import os
 import sys
@@ -20,8 +26,61 @@ reader = ReadNotion.ReadNotion()
 writer = WriteNotion.WriteNotion()
 pull = PuppyNotion.PullNotion()
 push = PuppyNotion.PushNotion()
-secrets = SecretAccess()
 
+logger = logging.getLogger(__name__)
+
+# Notion allows about 3 requests per second per integration
+NOTION_CONCURRENCY = 3
+
+WALLET = "0x200b0E0b2030c4F9fba3312C3C7505b9050aaFD6"
+# Errors a Multicall3 read can fail with: contract/ABI errors, JSON-RPC error
+# responses (raised as ValueError), undecodable return data and transport errors
+MULTICALL_ERRORS = (Web3Exception, ValueError, DecodingError, requests.RequestException)
+
+# Multicall3 is deployed at the same address on every supported network
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [{
+    "inputs": [{
+        "components": [
+            {"internalType": "address", "name": "target", "type": "address"},
+            {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+            {"internalType": "bytes", "name": "callData", "type": "bytes"}
+        ],
+        "internalType": "struct Multicall3.Call3[]",
+        "name": "calls",
+        "type": "tuple[]"
+    }],
+    "name": "aggregate3",
+    "outputs": [{
+        "components": [
+            {"internalType": "bool", "name": "success", "type": "bool"},
+            {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+        ],
+        "internalType": "struct Multicall3.Result[]",
+        "name": "returnData",
+        "type": "tuple[]"
+    }],
+    "stateMutability": "payable",
+    "type": "function"
+}]
+ERC20_ABI = [
+    {"inputs": [], "name": "decimals",
+     "outputs": [{"name": "", "type": "uint8"}],
+     "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "totalSupply",
+     "outputs": [{"name": "", "type": "uint256"}],
+     "stateMutability": "view", "type": "function"},
+    {"inputs": [{"name": "_owner", "type": "address"}], "name": "balanceOf",
+     "outputs": [{"name": "balance", "type": "uint256"}],
+     "stateMutability": "view", "type": "function"},
+]
+
+@functools.lru_cache(maxsize=1)
+def _ankr_key():
+    # Fetched from Secret Manager once per warm instance
+    return SecretAccess().get_token('ANKR')
+
+@functools.lru_cache(maxsize=8)
 def initiate_web3(network):
     if network == 'Sonic':
         network = 'sonic_mainnet'
@@ -30,12 +89,15 @@ def initiate_web3(network):
     else:
         return None
 
-    ankr_key = secrets.get_token('ANKR')
-    ankr = f"https://rpc.ankr.com/{network}/{ankr_key}"
-    web3 = Web3(Web3.HTTPProvider(ankr))
+    ankr = f"https://rpc.ankr.com/{network}/{_ankr_key()}"
+    # A dedicated session keeps the TCP/TLS connection to ANKR alive across calls
+    web3 = Web3(Web3.HTTPProvider(ankr, session=requests.Session()))
     return web3
 
 
+SUFFIXES = ('', 'K', 'M', 'B', 'T')
+DIVISORS = (1, 1e3, 1e6, 1e9, 1e12)
+
 def human_readable_abbreviated(number) -> str:
     """
     Convert a large integer (like a BigNumber) into a human-readable abbreviated string.
@@ -44,38 +106,111 @@ def human_readable_abbreviated(number) -> str:
     :param decimals: Number of token decimals (default is 18 for ETH).
     :return: Abbreviated human-readable string.
     """
-    
-    # Define suffixes
-    suffixes = ['', 'K', 'M', 'B', 'T']
-    magnitude = 0
-    
-    while abs(number) >= 1000 and magnitude < len(suffixes) - 1:
-        number /= 1000.0
-        magnitude += 1
-    
-    return f"{number:.2f}{suffixes[magnitude]}".rstrip('0').rstrip('.')
-
-def push_to_contract(token):
-    
-    token['totalSupply'] = Function().totalSupply(CONTEXT[token['Network']], token['Address'])
-    token['balanceOf'] = Function().balanceOf(CONTEXT[token['Network']], token['Address'])
-    if token['Address'] == '0x51F5DC1c581e309D73E1c6Ea74176077b3c44e60':
-        token['totalSupply'] = token['totalSupply']/1000
-        token['balanceOf'] = token['balanceOf']/1000
-        
-    page_id = token['page_id']
-
-    properties = dict()
-    properties['totalSupply'] = writer.number(token['totalSupply'])
-    properties['balanceOf'] = writer.number(token['balanceOf'])
-    visual_supply = human_readable_abbreviated(token['totalSupply'])
-    visual_balance = round(token['balanceOf'], 5)
-    properties['Actual Supply'] = writer.text(f"{visual_supply} {token['Name']}")
-    properties['Actual Balance'] = writer.text(f"{visual_balance} {token['Name']}")
-
-    body = {'parent': {'database_id': "1b50fcf38494801e843cda14be531c4a"},
-            'properties': properties}
-
-    response = push.push_to_notion(body, page_id)
-    log = {'status code':response.status_code, 'response': response}
-    return log
\ No newline at end of file
+    if not number:
+        return "0"
+
+    # Pick the suffix directly from the number of digits instead of dividing in a loop
+    magnitude = min(max(int(math.log10(abs(number)) // 3), 0), len(SUFFIXES) - 1)
+    number /= DIVISORS[magnitude]
+
+    return f"{number:.2f}{SUFFIXES[magnitude]}".rstrip('0').rstrip('.')
+
+def read_balances(web3, addresses):
+    """
+    Read totalSupply and balanceOf for many tokens of one network in a single RPC.
+
+    All decimals/totalSupply/balanceOf calls are packed into one Multicall3
+    aggregate3 eth_call instead of issuing them token by token.
+
+    :param web3: Web3 instance for the network.
+    :param addresses: Token contract addresses.
+    :return: List of (totalSupply, balanceOf) tuples, in the order of addresses.
+    """
+    multicall = web3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+    calls = []
+    for address in addresses:
+        erc20 = web3.eth.contract(address=address, abi=ERC20_ABI)
+        calls += [
+            (address, False, erc20.encodeABI(fn_name='decimals')),
+            (address, False, erc20.encodeABI(fn_name='totalSupply')),
+            (address, False, erc20.encodeABI(fn_name='balanceOf', args=[WALLET])),
+        ]
+
+    results = multicall.functions.aggregate3(calls).call()
+    values = [web3.codec.decode(['uint256'], data)[0] for _, data in results]
+    balances = []
+    for i in range(0, len(values), 3):
+        decimals, supply, balance = values[i:i + 3]
+        balances.append((supply / 10**decimals, balance / 10**decimals))
+    return balances
+
+def fetch_balances(tokens):
+    """
+    Fill totalSupply and balanceOf on every token, batching reads per network.
+
+    Falls back to one Function() call per read on networks where the
+    Multicall3 read fails (e.g. the contract is not deployed there).
+    Tokens on networks initiate_web3 does not support are skipped.
+
+    :param tokens: List of token dicts (Network, Address, ...).
+    :return: The tokens that were filled.
+    """
+    by_network = dict()
+    for token in tokens:
+        by_network.setdefault(token['Network'], []).append(token)
+
+    filled = []
+    for network, network_tokens in by_network.items():
+        web3 = initiate_web3(network)
+        if web3 is None:
+            logger.warning("Skipping %d tokens on unsupported network %s", len(network_tokens), network)
+            continue
+        try:
+            balances = read_balances(web3, [token['Address'] for token in network_tokens])
+        except MULTICALL_ERRORS as e:
+            logger.warning("Multicall3 read failed on %s, reading %d tokens one by one: %r",
+                           network, len(network_tokens), e)
+            balances = [
+                (Function().totalSupply(web3, token['Address']),
+                 Function().balanceOf(web3, token['Address']))
+                for token in network_tokens
+            ]
+        for token, (total_supply, balance) in zip(network_tokens, balances):
+            token['totalSupply'] = total_supply
+            token['balanceOf'] = balance
+        filled += network_tokens
+    return filled
+
+def push_to_contract(tokens):
+    """
+    Refresh supply and balance of each token and push them to Notion.
+
+    :param tokens: List of token dicts (Network, Address, Name, page_id).
+    :return: List of logs, one per token on a supported network.
+    """
+    tokens = fetch_balances(tokens)
+
+    def push_one(token):
+        if token['Address'] == '0x51F5DC1c581e309D73E1c6Ea74176077b3c44e60':
+            token['totalSupply'] = token['totalSupply']/1000
+            token['balanceOf'] = token['balanceOf']/1000
+
+        page_id = token['page_id']
+
+        properties = dict()
+        properties['totalSupply'] = writer.number(token['totalSupply'])
+        properties['balanceOf'] = writer.number(token['balanceOf'])
+        visual_supply = human_readable_abbreviated(token['totalSupply'])
+        visual_balance = round(token['balanceOf'], 5)
+        properties['Actual Supply'] = writer.text(f"{visual_supply} {token['Name']}")
+        properties['Actual Balance'] = writer.text(f"{visual_balance} {token['Name']}")
+
+        body = {'parent': {'database_id': "1b50fcf38494801e843cda14be531c4a"},
+                'properties': properties}
+
+        response = push.push_to_notion(body, page_id)
+        return {'status code':response.status_code, 'response': response}
+
+    # Pages are independent, so overlap the Notion round trips
+    with ThreadPoolExecutor(max_workers=NOTION_CONCURRENCY) as executor:
+        return list(executor.map(push_one, tokens))
@@ -3,6 +3,45 @@ from google.auth import default
 import logging  # Import standard Python logging module
 import json
 import os
+import threading
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), default=str)
+
+# Cloud Logging client shared by every CloudLogger in the process
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(project_id):
+    """Return the process-wide Cloud Logging client, creating it on first use.
+    
+    Credentials are resolved and the Cloud Logging handler is installed only
+    once, no matter how many CloudLogger instances are created.
+    
+    Args:
+        project_id (str): Google Cloud project ID
+        
+    Returns:
+        cloud_logging.Client: The shared client
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            credentials, _ = default()
+            client = cloud_logging.Client(
+                credentials=credentials,
+                project=project_id
+            )
+            client.setup_logging()
+            _CLIENT = client
+        return _CLIENT
 
 
 class CloudLogger(object):
@@ -35,15 +74,8 @@ class CloudLogger(object):
         self.project_id = "digital-africa-rainbow"
         
         try:
-            # Get credentials using Google Auth default
-            credentials, _ = default()
-            
-            # Set up Google Cloud Logging with default credentials and project
-            self.cloud_logging_client = cloud_logging.Client(
-                credentials=credentials,
-                project=self.project_id
-            )
-            self.cloud_logging_client.setup_logging()
+            # Share a single Google Cloud Logging client across instances
+            self.cloud_logging_client = _get_client(self.project_id)
             
             # Set up Python logger
             self.logger = logging.getLogger(logger_name)
@@ -87,7 +119,7 @@ class CloudLogger(object):
            
         if extra:
             # Convert extra dict to JSON string and append to message
-            extra_str = json.dumps(extra)
+            extra_str = _dumps(extra)
             return f"{msg} | Extra: {extra_str}"
         return msg
 
@@ -98,6 +130,8 @@ class CloudLogger(object):
             msg (str): The message to log
             extra (dict, optional): Additional parameters to include
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.info(formatted_msg)
 
@@ -108,6 +142,8 @@ class CloudLogger(object):
             msg (str): The message to log
             extra (dict, optional): Additional parameters to include
         """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.warning(formatted_msg)
 
@@ -118,6 +154,8 @@ class CloudLogger(object):
             msg (str): The message to log
             extra (dict, optional): Additional parameters to include
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.error(formatted_msg)
 
@@ -128,5 +166,7 @@ class CloudLogger(object):
             msg (str): The message to log
             extra (dict, optional): Additional parameters to include
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         formatted_msg = self._format_message(msg, extra)
         self.logger.debug(formatted_msg)
@@ -1,13 +1,71 @@
-from typing import List, Optional, Dict, Union
+from typing import IO, Iterator, List, Optional, Dict, Tuple, Union
 from google.cloud import storage
 from google.cloud.storage import Blob
+from google.api_core.exceptions import NotFound, NotModified
 import json
 import os
 from datetime import datetime
 import logging
 import pandas as pd
 import io
+import mmap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from google.auth import default
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.fs as pa_fs
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Clients and bucket handles shared by every GCSStorage in the process, so
+# credentials are resolved and connection pools built once per project/bucket.
+_CLIENT_CACHE: Dict[str, storage.Client] = {}
+_BUCKET_CACHE: Dict[Tuple[str, str], storage.Bucket] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Bytes moved per request on chunked downloads/uploads (must be a multiple of 256 KiB)
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Connection pool of the shared client session; requests' default of 10
+# connections per host would throttle the concurrent read_many/write_many paths
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# Bytes handed to each pyarrow CSV parsing thread
+ARROW_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Listing responses are projected to names only, skipping all other metadata
+LIST_FIELDS = "items(name),prefixes,nextPageToken"
+
+# Local JSON files from this size on are parsed from a memory map rather than
+# read into a buffer first; below it the mapping setup costs more than it saves
+MMAP_THRESHOLD = 64 * 1024
+
+# Parsed memory bank JSONs by blob path, as (fetched_at, etag, result). Entries
+# younger than REFERENCE_TTL seconds are served without any request; older ones
+# are revalidated with a conditional GET on the etag.
+_REFERENCE_CACHE: Dict[str, Tuple[float, Optional[str], Optional[Dict]]] = {}
+REFERENCE_TTL = 60
+
+# Memory bank JSONs published compressed are stored under this suffix
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 3
 
 class GCSStorage:
     """Google Cloud Storage client wrapper for simplified file operations.
@@ -35,12 +93,19 @@ class GCSStorage:
         """
         self.project = project_id
         self.client = self.get_client()
-        self.bucket = self.client.bucket(bucket_name)
+        with _CACHE_LOCK:
+            key = (project_id, bucket_name)
+            if key not in _BUCKET_CACHE:
+                _BUCKET_CACHE[key] = self.client.bucket(bucket_name)
+            self.bucket = _BUCKET_CACHE[key]
         
     def get_client(self) -> storage.Client:
-        """Create and return an authenticated Google Cloud Storage client.
+        """Return the authenticated Google Cloud Storage client for the project.
         
-        Uses Google Application Credentials for authentication.
+        Uses Google Application Credentials for authentication. The client is
+        created on first use and shared by every GCSStorage of the same project,
+        so its authorized session (and OAuth token) and enlarged connection
+        pool are reused across calls.
         
         Returns:
             storage.Client: Authenticated Google Cloud Storage client
@@ -48,8 +113,52 @@ class GCSStorage:
         Raises:
             Exception: If authentication fails
         """
-        creds, _ = default()
-        return storage.Client(credentials=creds, project=self.project)
+        with _CACHE_LOCK:
+            if self.project not in _CLIENT_CACHE:
+                creds, _ = default()
+                client = storage.Client(credentials=creds, project=self.project)
+                client._http.mount("https://", HTTPAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE,
+                ))
+                _CLIENT_CACHE[self.project] = client
+            return _CLIENT_CACHE[self.project]
+            
+    def _open(self, blob_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> IO[bytes]:
+        """Open a blob for streaming reads.
+        
+        The returned file object downloads the blob chunk by chunk as it is
+        read, so parsers can consume it without the whole object being
+        buffered in memory first.
+        
+        Args:
+            blob_name (str): Name/path of the blob in the bucket
+            chunk_size (int, optional): Bytes fetched per download request
+            
+        Returns:
+            IO[bytes]: Seekable binary file object over the blob
+        """
+        return self.bucket.blob(blob_name, chunk_size=chunk_size).open("rb")
+    
+    def read_file_stream(self, blob_name: str) -> IO[bytes]:
+        """Open a file in Google Cloud Storage as a binary stream.
+        
+        Use this instead of read_file for large blobs, so the content is
+        processed incrementally instead of loaded into memory at once.
+        
+        Args:
+            blob_name (str): Name/path of the blob in the bucket
+            
+        Returns:
+            IO[bytes]: Binary file object; use it as a context manager
+            
+        Example:
+            >>> storage = GCSStorage('my-bucket')
+            >>> with storage.read_file_stream('data/large.csv') as f:
+            ...     for chunk in pd.read_csv(f, chunksize=10000):
+            ...         print(len(chunk))
+        """
+        return self._open(blob_name)
             
     def read_file(self, blob_name: str) -> Optional[bytes]:
         """Read a file from Google Cloud Storage.
@@ -69,8 +178,8 @@ class GCSStorage:
             ...     print(content.decode('utf-8'))
         """
         try:
-            blob = self.bucket.blob(blob_name)
-            return blob.download_as_bytes()
+            blob = self.bucket.blob(blob_name, chunk_size=DEFAULT_CHUNK_SIZE)
+            return blob.download_as_bytes(checksum=None)
         except Exception as e:
             logging.error(f"Error reading file {blob_name}: {e}")
             return None
@@ -94,7 +203,7 @@ class GCSStorage:
             >>> success = storage.write_file('hello.txt', content, 'text/plain')
         """
         try:
-            blob = self.bucket.blob(blob_name)
+            blob = self.bucket.blob(blob_name, chunk_size=DEFAULT_CHUNK_SIZE)
             blob.upload_from_string(
                 content,
                 content_type=content_type
@@ -104,12 +213,88 @@ class GCSStorage:
             logging.error(f"Error writing file {blob_name}: {e}")
             return False
             
-    def list_new_files(self, prefix: str = "") -> List[str]:
+    def open_write(self, blob_name: str, content_type: str = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, text: bool = False) -> IO:
+        """Open a file in Google Cloud Storage for streaming writes.
+        
+        Data is uploaded chunk by chunk as it is written, so content produced
+        incrementally never has to be fully materialized in memory.
+        
+        Args:
+            blob_name (str): Name/path where to store the file in the bucket
+            content_type (str, optional): MIME type of the content
+            chunk_size (int, optional): Bytes sent per upload request
+            text (bool, optional): Open in text mode instead of binary
+            
+        Returns:
+            IO: Writable file object; the upload completes when it is closed
+            
+        Example:
+            >>> storage = GCSStorage('my-bucket')
+            >>> with storage.open_write('data.json', 'application/json', text=True) as f:
+            ...     json.dump({'key': 'value'}, f)
+        """
+        blob = self.bucket.blob(blob_name, chunk_size=chunk_size)
+        return blob.open("w" if text else "wb", content_type=content_type)
+    
+    def read_many(self, blob_names: List[str], workers: int = 8) -> Dict[str, Optional[bytes]]:
+        """Read several files from Google Cloud Storage concurrently.
+        
+        Downloads are network-bound, so running them on a thread pool overlaps
+        their round trips instead of paying them one after another.
+        
+        Args:
+            blob_names (List[str]): Names/paths of the blobs to read
+            workers (int, optional): Number of concurrent downloads. Defaults to 8.
+            
+        Returns:
+            Dict[str, Optional[bytes]]: Content per blob name, None for failed reads
+            
+        Example:
+            >>> storage = GCSStorage('my-bucket')
+            >>> contents = storage.read_many(['a.json', 'b.json'])
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(blob_names, executor.map(self.read_file, blob_names)))
+    
+    def write_many(self, items: List[Tuple[str, bytes]], content_type: str = None, workers: int = 8) -> Dict[str, bool]:
+        """Write several files to Google Cloud Storage concurrently.
+        
+        Args:
+            items (List[Tuple[str, bytes]]): (blob name, content) pairs to upload
+            content_type (str, optional): MIME type shared by all the files
+            workers (int, optional): Number of concurrent uploads. Defaults to 8.
+            
+        Returns:
+            Dict[str, bool]: Upload success per blob name
+            
+        Example:
+            >>> storage = GCSStorage('my-bucket')
+            >>> storage.write_many([('a.txt', b'A'), ('b.txt', b'B')], 'text/plain')
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda item: self.write_file(item[0], item[1], content_type),
+                items
+            )
+            return dict(zip([name for name, _ in items], results))
+            
+    def list_new_files(self, prefix: str = "", delimiter: Optional[str] = None,
+                       match_glob: Optional[str] = None, max_results: Optional[int] = None,
+                       page_size: int = 1000) -> List[str]:
         """List all files in the bucket with optional prefix filtering.
         
+        Filtering happens server-side, so only matching names are transferred.
+        
         Args:
             prefix (str, optional): Prefix to filter files. Only files whose names
                 start with this prefix will be returned. Defaults to "" (all files).
+            delimiter (str, optional): Restrict the listing to immediate children
+                of the prefix (e.g. "/"). The "sub-directory" prefixes found are
+                appended to the result, each ending with the delimiter.
+            match_glob (str, optional): Glob pattern names must match (e.g. "**.csv")
+            max_results (int, optional): Stop after this many files
+            page_size (int, optional): Number of names fetched per request
             
         Returns:
             List[str]: List of blob names matching the prefix
@@ -118,19 +303,50 @@ class GCSStorage:
             >>> storage = GCSStorage('my-bucket')
             >>> files = storage.list_new_files('data/')
             >>> print(f"Found {len(files)} files in data/ directory")
+            >>> children = storage.list_new_files('data/', delimiter='/')
         """
         try:
-            blobs = self.bucket.list_blobs(prefix=prefix)
-            new_files = []
-            
-            for blob in blobs:
-                new_files.append(blob.name)
+            blobs = self.bucket.list_blobs(
+                prefix=prefix,
+                delimiter=delimiter,
+                match_glob=match_glob,
+                max_results=max_results,
+                page_size=page_size,
+                fields=LIST_FIELDS
+            )
+            new_files = [blob.name for blob in blobs]
+            if delimiter:
+                new_files.extend(sorted(blobs.prefixes))
             return new_files
         
         except Exception as e:
             logging.error(f"Error listing new files: {e}")
             return []
 
+    def iter_blob_names(self, prefix: str = "", match_glob: Optional[str] = None,
+                        page_size: int = 1000) -> Iterator[str]:
+        """Lazily iterate over the names of the files in the bucket.
+        
+        Pages are fetched as the iterator is consumed, so callers scanning or
+        filtering a large bucket never hold the whole listing in memory.
+        
+        Args:
+            prefix (str, optional): Prefix to filter files. Defaults to "" (all files).
+            match_glob (str, optional): Glob pattern names must match (e.g. "**.csv")
+            page_size (int, optional): Number of names fetched per request
+            
+        Yields:
+            str: Blob names matching the prefix
+            
+        Example:
+            >>> storage = GCSStorage('my-bucket')
+            >>> for name in storage.iter_blob_names('data/', match_glob='**.csv'):
+            ...     print(name)
+        """
+        for blob in self.bucket.list_blobs(prefix=prefix, match_glob=match_glob,
+                                           page_size=page_size, fields=LIST_FIELDS):
+            yield blob.name
+
     def read_excel(self, blob_name: str, **kwargs) -> Optional[pd.DataFrame]:
         """Read an Excel file from GCS and return it as a pandas DataFrame.
         
@@ -158,15 +374,9 @@ class GCSStorage:
             ...     print(df.head())
         """
         try:
-            content = self.read_file(blob_name)
-            if content is None:
-                return None
-                
-            # Create a BytesIO object from the content
-            excel_data = io.BytesIO(content)
-            
-            # Read the Excel file into a DataFrame
-            df = pd.read_excel(excel_data, **kwargs)
+            # Read the Excel file into a DataFrame straight from the blob stream
+            with self._open(blob_name) as excel_data:
+                df = pd.read_excel(excel_data, **kwargs)
             return df
             
         except Exception as e:
@@ -191,19 +401,19 @@ class GCSStorage:
             >>> success = storage.copy_file('data/input.csv', 'backup/input.csv')
         """
         try:
-            # Check if source file exists
+            # Copy the file (source file is preserved); a missing source
+            # surfaces as NotFound, so no separate existence check is needed.
+            # Large objects are copied over several rewrite calls, each resuming
+            # from the token returned by the previous one.
             source_blob = self.bucket.blob(source_blob_name)
-            if not source_blob.exists():
-                logging.error(f"Source file {source_blob_name} does not exist")
-                return False
-                
-            # Copy the file (source file is preserved)
-            new_blob = self.bucket.copy_blob(
-                source_blob,
-                self.bucket,
-                destination_blob_name
-            )
+            new_blob = self.bucket.blob(destination_blob_name)
+            token, _, _ = new_blob.rewrite(source_blob)
+            while token is not None:
+                token, _, _ = new_blob.rewrite(source_blob, token=token)
             return True
+        except NotFound:
+            logging.error(f"Source file {source_blob_name} does not exist")
+            return False
         except Exception as e:
             logging.error(f"Error copying file from {source_blob_name} to {destination_blob_name}: {e}")
             return False 
@@ -237,7 +447,7 @@ class GCSStorage:
                 return {'status': False, 'message': f"Source file {file_path} does not exist"}
                 
             # Create a new blob and upload the file
-            blob = self.bucket.blob(destination_blob_name)
+            blob = self.bucket.blob(destination_blob_name, chunk_size=DEFAULT_CHUNK_SIZE)
             blob.upload_from_filename(file_path, content_type=content_type)
             return {'status': True, 'message': f"File saved to {destination_blob_name}",'blob': blob}
         except Exception as e:
@@ -262,12 +472,11 @@ class GCSStorage:
             ...     print(f"API key: {data.get('api_key')}")
         """
         try:
-            content = self.read_file(blob_name)
-            if content is None:
-                return None
-                
-            # Parse the JSON content
-            return json.loads(content.decode('utf-8'))
+            # Parse the JSON bytes directly, with orjson when it is installed
+            with self._open(blob_name) as json_data:
+                if orjson is not None:
+                    return orjson.loads(json_data.read())
+                return json.load(json_data)
             
         except json.JSONDecodeError as e:
             logging.error(f"Error parsing JSON from {blob_name}: {e}")
@@ -304,20 +513,83 @@ class GCSStorage:
             ...     print(f"Loaded {len(df)} rows")
         """
         try:
-            content = self.read_file(blob_name)
-            if content is None:
-                return None
-                
-            # Create a BytesIO object from the content
-            csv_data = io.BytesIO(content)
-            
-            # Read the CSV file into a DataFrame
-            df = pd.read_csv(csv_data, **kwargs)
+            # Read the CSV file into a DataFrame straight from the blob stream
+            with self._open(blob_name) as csv_data:
+                df = pd.read_csv(csv_data, **kwargs)
             return df
             
         except Exception as e:
             logging.error(f"Error reading CSV file {blob_name}: {e}")
             return None 
+
+    def read_csv_arrow(self, blob_name: str, **kwargs) -> Optional["pa.Table"]:
+        """Read a CSV file from GCS into a pyarrow Table.
+        
+        Uses pyarrow's multithreaded C++ parser, much faster than
+        pandas.read_csv on large or wide files. Call .to_pandas() on the
+        result when a DataFrame is needed. Requires pyarrow.
+        
+        Args:
+            blob_name (str): Name/path of the CSV file in the bucket
+            **kwargs: Additional arguments to pass to pyarrow.csv.read_csv()
+                (parse_options, convert_options)
+                
+        Returns:
+            Optional[pa.Table]: Table containing the CSV data if successful,
+                None if failed
+            
+        Example:
+            >>> storage = GCSStorage('my-bucket')
+            >>> table = storage.read_csv_arrow('data/users.csv')
+            >>> if table is not None:
+            ...     print(f"Loaded {table.num_rows} rows")
+        """
+        if pa is None:
+            logging.error(f"Error reading CSV file {blob_name}: pyarrow is not installed")
+            return None
+        try:
+            read_options = pa_csv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE)
+            with self._open(blob_name) as csv_data:
+                return pa_csv.read_csv(csv_data, read_options=read_options, **kwargs)
+            
+        except Exception as e:
+            logging.error(f"Error reading CSV file {blob_name}: {e}")
+            return None
+        
+    def read_parquet(self, blob_name: str, columns: Optional[List[str]] = None, **kwargs) -> Optional["pa.Table"]:
+        """Read a Parquet file from GCS into a pyarrow Table.
+        
+        The file is read through pyarrow's GCS filesystem, so only the footer
+        and the column chunks of the requested columns are downloaded.
+        Requires pyarrow.
+        
+        Args:
+            blob_name (str): Name/path of the Parquet file in the bucket
+            columns (List[str], optional): Columns to read. Defaults to all.
+            **kwargs: Additional arguments to pass to pyarrow.parquet.read_table()
+                
+        Returns:
+            Optional[pa.Table]: Table containing the Parquet data if successful,
+                None if failed
+            
+        Example:
+            >>> storage = GCSStorage('my-bucket')
+            >>> table = storage.read_parquet('data/events.parquet', columns=['id', 'date'])
+        """
+        if pa is None:
+            logging.error(f"Error reading Parquet file {blob_name}: pyarrow is not installed")
+            return None
+        try:
+            return pq.read_table(
+                f"{self.bucket.name}/{blob_name}",
+                columns=columns,
+                filesystem=pa_fs.GcsFileSystem(),
+                **kwargs
+            )
+            
+        except Exception as e:
+            logging.error(f"Error reading Parquet file {blob_name}: {e}")
+            return None
         
 class Reference:
     """Reference paths for commonly used files in the storage bucket.
@@ -347,6 +619,7 @@ class Operation:
     def __init__(self):
         """Initialize the Operation class with agent memory bank configuration."""
         self.bucket_name = 'agent-memory-bank'
+        self._gcs = GCSStorage(self.bucket_name)
     
     def get(self, location: str) -> Dict[str, Union[str, Optional[Dict]]]:
         """Retrieve data from the agent memory bank.
@@ -364,15 +637,62 @@ class Operation:
             >>> data = op.get('references/Persons.json')
             >>> if data['result']:
             ...     print(f"Retrieved {len(data['result'])} persons")
+            
+        Note:
+            Results are cached per process and shared between calls, so treat
+            them as read-only.
         """
-        context = {'bucket_name': self.bucket_name}
-        params = {'blob_name': location}
-        result = GCSStorage(**context).read_json(**params)
+        cached = _REFERENCE_CACHE.get(location)
+        if cached is not None and time.monotonic() - cached[0] < REFERENCE_TTL:
+            result = cached[2]
+        else:
+            result = self._fetch(location, cached)
         return {
                     'location': location, 
                     'result': result
                 }
     
+    def _fetch(self, location: str, cached: Optional[Tuple[float, Optional[str], Optional[Dict]]]) -> Optional[Dict]:
+        """Download and parse a memory bank JSON, revalidating any cached copy.
+        
+        When an etag is cached the download is conditional, and an unchanged
+        blob is answered with a 304 instead of its content.
+        
+        Blobs ending in .zst are decompressed with zstandard before parsing;
+        without zstandard installed they cannot be read and None is returned.
+        
+        Args:
+            location (str): Path to the JSON file in the bucket
+            cached (Optional[Tuple]): Previous cache entry for the location
+            
+        Returns:
+            Optional[Dict]: Parsed JSON data if successful, None if failed
+        """
+        if location.endswith(ZSTD_SUFFIX) and zstandard is None:
+            logging.error(f"Error reading JSON file {location}: zstandard is not installed")
+            return None
+        blob = self._gcs.bucket.blob(location)
+        try:
+            if cached is not None and cached[1]:
+                content = blob.download_as_bytes(if_etag_not_match=cached[1])
+            else:
+                content = blob.download_as_bytes()
+            if location.endswith(ZSTD_SUFFIX):
+                content = zstandard.ZstdDecompressor().decompress(content)
+            result = orjson.loads(content) if orjson is not None else json.loads(content)
+        except NotModified:
+            _REFERENCE_CACHE[location] = (time.monotonic(), cached[1], cached[2])
+            return cached[2]
+        except json.JSONDecodeError as e:
+            logging.error(f"Error parsing JSON from {location}: {e}")
+            return None
+        except Exception as e:
+            logging.error(f"Error reading JSON file {location}: {e}")
+            return None
+        
+        _REFERENCE_CACHE[location] = (time.monotonic(), blob.etag, result)
+        return result
+    
     def update(self, location: str, key: str, val: any) -> None:
         """Update a local JSON file with new key-value pair.
         
@@ -388,34 +708,117 @@ class Operation:
             >>> op = Operation()
             >>> op.update('local/config.json', 'last_update', '2024-01-01')
         """
+        self.batch_update(location, {key: val})
+    
+    def batch_update(self, location: str, updates: Dict) -> None:
+        """Apply several key-value pairs to a local JSON file at once.
+        
+        The file is read and rewritten a single time whatever the number of
+        keys, so prefer this over repeated calls to update. The new content is
+        written to a temporary file first and moved into place, so a failed
+        write never leaves a truncated file behind.
+        
+        Args:
+            location (str): Local path to the JSON file
+            updates (Dict): Keys to update or add, with their values
+            
+        Example:
+            >>> op = Operation()
+            >>> op.batch_update('local/config.json', {'last_update': '2024-01-01', 'count': 3})
+        """
         try:
-            with open(location, 'r') as json_file:
-                target = json.load(json_file)
-
-            target[key] = val
-        except:
+            target = self._load_local(location)
+        except FileNotFoundError:
             target = dict()
-            target[key] = val
             print(f'file not found at {location}\nCreating a new file')
-
-        # Write the updated JSON back to the file
-        with open(location, 'w') as json_file:
-            json.dump(target, json_file, indent=4)
+        except json.JSONDecodeError as e:
+            target = dict()
+            logging.error(f"Error parsing JSON from {location}, rewriting it: {e}")
+        
+        target.update(updates)
+        
+        # Write the updated JSON next to the file, then swap it in
+        tmp = location + '.tmp'
+        if orjson is not None:
+            with open(tmp, 'wb') as json_file:
+                json_file.write(orjson.dumps(target, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp, 'w') as json_file:
+                json.dump(target, json_file, indent=4)
+        os.replace(tmp, location)
+    
+    @staticmethod
+    def _load_local(location: str) -> Dict:
+        """Parse a local JSON file.
+        
+        Large files are parsed by orjson straight from a read-only memory map,
+        letting the kernel page the file in without an intermediate copy.
+        
+        Args:
+            location (str): Local path to the JSON file
+            
+        Returns:
+            Dict: Parsed JSON data
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        with open(location, 'rb') as json_file:
+            if orjson is None:
+                return json.load(json_file)
+            if os.fstat(json_file.fileno()).st_size < MMAP_THRESHOLD:
+                return orjson.loads(json_file.read())
+            with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    
+    def publish_json(self, location: str, target: Dict) -> None:
+        """Publish data to the agent memory bank without a local file.
+        
+        The JSON is serialized straight into a streaming upload.
+        
+        Args:
+            location (str): Path of the JSON file in the bucket
+            target (Dict): Data to publish
+            
+        Example:
+            >>> op = Operation()
+            >>> op.publish_json('references/Persons.json', persons)
+        """
+        with self._gcs.open_write(location, "application/json", text=True) as json_file:
+            json.dump(target, json_file)
+        print(f"gs://{location}")
     
-    def publish(self, location: str) -> None:
+    def publish(self, location: str, compress: bool = False) -> None:
         """Publish a local JSON file to the agent memory bank.
         
-        Uploads a local JSON file to the agent memory bank bucket.
+        Uploads a local JSON file to the agent memory bank bucket. With
+        compress, the file is zstd-compressed and stored as <location>.zst,
+        which get decompresses transparently. Without zstandard installed the
+        file is published uncompressed instead.
         
         Args:
             location (str): Local path to the JSON file to publish
+            compress (bool, optional): Upload zstd-compressed. Defaults to False.
             
         Example:
             >>> op = Operation()
             >>> op.publish('local/updated_persons.json')
+            >>> op.publish('references/Persons.json', compress=True)
+            >>> op.get('references/Persons.json.zst')
         """
-        context = {'bucket_name': self.bucket_name}
+        if compress and zstandard is None:
+            logging.error(f"Error compressing {location}: zstandard is not installed, publishing uncompressed")
+            compress = False
+        if compress:
+            with open(location, 'rb') as json_file:
+                content = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(json_file.read())
+            destination = location + ZSTD_SUFFIX
+            result = self._gcs.write_file(destination, content, "application/zstd")
+            print(f"gs://{destination}", result)
+            return
         params = {'file_path': location, 'destination_blob_name': location, 'content_type': "application/json"}
-        result = GCSStorage(**context).save_file(**params)
+        result = self._gcs.save_file(**params)
         print(f"gs://{location}", result)
-    
\ No newline at end of file
+        
\ No newline at end of file
@@ -1,12 +1,19 @@
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from flask import Request
 from google.cloud.firestore_v1 import FieldFilter
 import functions_framework
 from google.cloud import firestore
 import uuid
-import traceback
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 from packages.Notion import Notion
 from packages.Firestore import StorageDriveFolder, NotionDatabase, Person
@@ -16,6 +23,116 @@ from packages.Drive import Drive
 from packages.Slack import SlackAPI
 
 
+# Precomputed CORS responses; preflight requests are answered before any logging
+_CORS_PREFLIGHT_RESPONSE = ('', 204, {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Max-Age': '3600'
+})
+_CORS_HEADERS = {'Access-Control-Allow-Origin': '*'}
+
+# Collaborators are stateless API clients, so warm instances share one of each
+# across requests instead of rebuilding them (and re-reading secrets) per call.
+_CLIENTS: Dict[type, Any] = {}
+
+
+def _shared(factory: type) -> Any:
+    """Return the instance-wide singleton built by ``factory``."""
+    client = _CLIENTS.get(factory)
+    if client is None:
+        client = _CLIENTS[factory] = factory()
+    return client
+
+
+# Worker threads overlapping the independent Notion/Firestore calls of a request;
+# kept at module scope so warm instances reuse them across invocations
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logger() -> Any:
+    """Logger of the function, set up once per instance.
+
+    CloudLogger attaches a Cloud Logging handler on construction, so building
+    it per request would also stack duplicate handlers on warm instances.
+    """
+    return CloudLogger("tiers_card", 'tiers_card')
+
+
+# Notion database ids by name, as (resolved_at, id); ids are stable, but entries
+# expire after DB_ID_TTL seconds so a re-created database is eventually picked up
+_DB_IDS: Dict[str, Tuple[float, str]] = {}
+DB_ID_TTL = 3600
+
+
+def _db_id(name: str) -> str:
+    """Notion database id of the named collection, cached per instance."""
+    cached = _DB_IDS.get(name)
+    if cached is not None and time.monotonic() - cached[0] < DB_ID_TTL:
+        return cached[1]
+    db_id = NotionDatabase().query(name)['id']
+    _DB_IDS[name] = (time.monotonic(), db_id)
+    return db_id
+
+
+def _tiers_db_id() -> str:
+    """Notion database id of the Tiers collection."""
+    return _db_id('Tiers')
+
+
+# Person documents by Notion user id, as (fetched_at, person); short-lived so
+# Slack id changes propagate, and misses are not cached
+_PERSONS: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+PERSON_TTL = 300
+
+
+def _person(notion_id: str) -> Optional[Dict[str, Any]]:
+    """Person document of a Notion user, cached per instance."""
+    cached = _PERSONS.get(notion_id)
+    if cached is not None and time.monotonic() - cached[0] < PERSON_TTL:
+        return cached[1]
+    person = _shared(Person).query_notion_id(notion_id)
+    if person is not None:
+        _PERSONS[notion_id] = (time.monotonic(), person)
+    return person
+
+
+# Fields read from the Notion page of the webhook, as (payload key, field named
+# in validation errors, path to the value); the paths are fixed at import so
+# extraction is a flat lookup loop that stops at the first missing field
+_REQUIRED_FIELDS = (
+    ('Tiers', 'Tiers', ('properties', 'Tiers', 'title', 0, 'plain_text')),
+    ('request_person', 'Person Request', ('properties', 'Person Request', 'people', 0, 'id')),
+    ('page_id', 'id', ('id',)),
+)
+_DRIVE_URL_PATH = ('properties', 'Drive', 'url')
+
+
+def _dig(data: Any, path: Tuple) -> Any:
+    """Follow ``path`` through nested dicts/lists, None if any step is missing."""
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+
+def _parse_body(request: Request) -> Dict[str, Any]:
+    """Decode the raw JSON request body, with orjson when it is installed.
+
+    Malformed or non-object bodies yield an empty dict, which request
+    validation then rejects.
+    """
+    data = request.get_data(cache=False)
+    try:
+        body = orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
 class TiersCardManager:
     """Manages the creation and handling of tier cards in Notion and Firestore.
     
@@ -24,68 +141,64 @@ class TiersCardManager:
     """
     
     def __init__(self, logger: Any):
-        """Initialize the TiersCardManager with lazy loading."""
+        """Initialize the TiersCardManager; collaborators are built on first use."""
         self.logger = logger
-        self._notion = None
-        self._storage = None
-        self._drive = None
-        self._person = None
     
-    @property
+    @functools.cached_property
     def notion(self):
         """Lazy load Notion client."""
-        if self._notion is None:
-            self._notion = Notion()
-        return self._notion
+        return _shared(Notion)
 
-    @property
+    @functools.cached_property
     def storage(self):
         """Lazy load Storage client."""
-        if self._storage is None:
-            self._storage = StorageDriveFolder()
-        return self._storage
+        return _shared(StorageDriveFolder)
 
-    @property
+    @functools.cached_property
     def drive(self):
         """Lazy load Drive client."""
-        if self._drive is None:
-            self._drive = Drive()
-        return self._drive
+        return _shared(Drive)
 
-    @property
+    @functools.cached_property
     def person(self):
         """Lazy load Person client."""
-        if self._person is None:
-            self._person = Person()
-        return self._person
+        return _shared(Person)
 
-    def _extract_request_data(self, request: Request) -> Dict[str, Any]:
-        """Extract and validate data from the request with minimal memory usage."""
-        try:
-            request_data = request.get_json(force=True).get('data')
-            if not request_data:
-                self.logger.error("Request validation failed - no data found", extra={
-                    'request_id': request.headers.get('X-Request-ID', 'unknown')
-                })
-                raise ValueError("No data found in request")
-            
-            # Extract only needed fields
-            return {
-                'Tiers': request_data['properties']['Tiers']['title'][0]['plain_text'],
-                #'Drive': request_data['properties']['Drive']['url'],
-                'request_person': request_data['properties']['Person Request']['people'][0]['id'],
-                'page_id': request_data['id']
-            }
-        except KeyError as e:
-            self.logger.error("Request validation failed - missing required field", extra={
-                'request_id': request.headers.get('X-Request-ID', 'unknown'),
-                'missing_field': str(e)
+    @functools.cached_property
+    def batch(self):
+        """Firestore WriteBatch collecting this request's writes until flush_writes."""
+        return self.storage.client_firestore.batch()
+
+    def flush_writes(self) -> None:
+        """Commit the Firestore writes queued during the request in one round-trip."""
+        batch = self.__dict__.pop('batch', None)
+        if batch is not None:
+            batch.commit()
+
+    def _extract_request_data(self, body: Dict[str, Any], request_id: str = 'unknown') -> Dict[str, Any]:
+        """Extract and validate data from the already parsed request body."""
+        request_data = body.get('data')
+        if not request_data:
+            self.logger.error("Request validation failed - no data found", extra={
+                'request_id': request_id
             })
-            raise ValueError(f"Missing required field: {str(e)}")
+            raise ValueError("No data found in request")
+        
+        extracted = {}
+        for key, field, path in _REQUIRED_FIELDS:
+            extracted[key] = _dig(request_data, path)
+            if extracted[key] is None:
+                self.logger.error("Request validation failed - missing required field", extra={
+                    'request_id': request_id,
+                    'missing_field': repr(field)
+                })
+                raise ValueError(f"Missing required field: {field!r}")
+        extracted['url'] = _dig(request_data, _DRIVE_URL_PATH)
+        return extracted
     
-    def _create_drive_folder(self, tiers_name: str, root: str, permissions_list: List[str]) -> Dict[str, Any]:
+    def _create_drive_folder(self, tiers_name: str, root: str, permissions_list: List[str],
+                             request_id: str = 'unknown') -> Dict[str, Any]:
         """Create a folder in Google Drive."""
-        request_id = self.logger.request_id
         self.logger.info("Initiating Drive folder creation", extra={
             'request_id': request_id,
             'tiers_name': tiers_name,
@@ -102,57 +215,45 @@ class TiersCardManager:
             })
             return drive_document
         except Exception as e:
-            self.logger.error("Drive folder creation failed", extra={
+            self.logger.exception("Drive folder creation failed", extra={
                 'request_id': request_id,
                 'error': str(e),
                 'error_type': type(e).__name__,
                 'tiers_name': tiers_name,
-                'root_folder_id': root,
-                'stack_trace': traceback.format_exc()
+                'root_folder_id': root
             })
             raise
     
-    def create_tiers(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a tiers folder with optimized memory usage."""
+    def dispatch(self, payload: Dict[str, Any], root: Optional[str], request_id: str = 'unknown') -> Dict[str, Any]:
+        """Record a tiers card, creating its Drive folder first when it has none yet."""
+        if not payload.get('url'):
+            payload.update(self._create_drive_folder(payload['Tiers'], root, [], request_id))
+        return self.create_tiers(payload, request_id)
+    
+    def create_tiers(self, payload: Dict[str, Any], request_id: str = 'unknown') -> Dict[str, Any]:
+        """Store a tiers card whose Drive folder exists in Firestore and Notion."""
         try:
-            writer = self.notion.writer
-            collection_name = 'Tiers'
-            
-            # Create minimal properties object
-            properties = {
-                "_self_": writer.relation(payload['page_id']),
-                'id': writer.text(payload['page_id']),
-                'Drive': writer.url(payload['url'])
-            }
+            self.firestore_add_tiers_card(payload, request_id)
 
-            # Store in Firestore with minimal data
-            self.storage.client_firestore.collection(collection_name).document(payload['page_id']).set({
-                'page_id': payload['page_id'],
-                'Tiers': payload.get('Tiers'),
-                'Drive': payload.get('url'),
-                'Contract': []
-            }, merge=True)
-
-            # Create Notion page
-            response = CapsuleNotion(
-                page_id=payload['page_id'],
-                database=NotionDatabase().query('Tiers')['id'],
-                properties=properties
-            ).run()
-            
-            return response.json()
+            # The Firestore commit overlaps the Notion update, but is always
+            # awaited: work left running after the response may be frozen
+            commit = _POOL.submit(self.flush_writes)
+            try:
+                return self.notion_update_tiers(payload, request_id)
+            finally:
+                # Re-raises a failed commit to the caller
+                commit.result()
             
         except Exception as e:
-            self.logger.error("Error creating tiers folder", extra={
+            self.logger.exception("Error creating tiers folder", extra={
+                'request_id': request_id,
                 'error': str(e),
-                'error_type': type(e).__name__,
-                'stack_trace': str(e.__traceback__)
+                'error_type': type(e).__name__
             })
             raise
     
-    def firestore_add_tiers_card(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Add a document to Firestore with minimal data."""
-        request_id = self.logger.request_id
+    def firestore_add_tiers_card(self, payload: Dict[str, Any], request_id: str = 'unknown') -> Dict[str, Any]:
+        """Queue a document write with minimal data; committed by flush_writes."""
         try:
             collection_name = 'Tiers'
             # Only store essential fields
@@ -160,11 +261,12 @@ class TiersCardManager:
                 'page_id': payload['page_id'],
                 'Tiers': payload.get('Tiers'),
                 'Drive': payload.get('url'),
-                'Contract': [],
-                'folder_id': payload.get('folder_id')
+                'Contract': []
             }
+            if payload.get('folder_id'):
+                essential_data['folder_id'] = payload['folder_id']
             
-            self.storage.client_firestore.collection(collection_name).document(payload['page_id']).set(essential_data, merge=True)
+            self.batch.set(self.storage.client_firestore.collection(collection_name).document(payload['page_id']), essential_data, merge=True)
             return 'ok'
         except Exception as e:
             self.logger.error("Failed to add document to Firestore", extra={
@@ -173,9 +275,8 @@ class TiersCardManager:
             })
             raise
     
-    def notion_update_tiers(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def notion_update_tiers(self, payload: Dict[str, Any], request_id: str = 'unknown') -> Dict[str, Any]:
         """Update a document in Notion with minimal data."""
-        request_id = self.logger.request_id
         try:
             writer = self.notion.writer            
             # Only include essential properties
@@ -187,7 +288,7 @@ class TiersCardManager:
 
             params = {
                 'page_id': payload['page_id'],
-                'database': NotionDatabase().query('Tiers')['id'],
+                'database': _tiers_db_id(),
                 'properties': properties
             }
             
@@ -200,8 +301,7 @@ class TiersCardManager:
             })
             raise
 
-    def send_slack_message(self, request_person, message):
-        request_id = self.logger.request_id
+    def send_slack_message(self, request_person, message, request_id='unknown'):
         try:
             self.logger.info("Sending Slack message", extra={
                 'request_id': request_id,
@@ -209,7 +309,7 @@ class TiersCardManager:
                 'message_length': len(message)
             })
             
-            user_id = Person().query_notion_id(request_person)
+            user_id = _person(request_person)
             SlackAPI().send_direct_message(user_id['slack_id'], message)
             
             self.logger.info("Successfully sent Slack message", extra={
@@ -218,60 +318,69 @@ class TiersCardManager:
                 'slack_user_id': user_id['slack_id']
             })
         except Exception as e:
-            self.logger.error("Failed to send Slack message", extra={
+            self.logger.exception("Failed to send Slack message", extra={
                 'request_id': request_id,
                 'error': str(e),
                 'error_type': type(e).__name__,
-                'request_person': request_person,
-                'stack_trace': traceback.format_exc()
+                'request_person': request_person
             })
             raise
 
+
+def _warm_up() -> None:
+    """Open the Firestore and Notion connections of a fresh instance.
+
+    Runs once in the background at cold start so OAuth token minting, TLS
+    setup and the Tiers database id lookup are done before the first request
+    needs them. Failures only mean the first request pays that cost itself.
+    """
+    try:
+        _shared(StorageDriveFolder).client_firestore.collection('Tiers').limit(1).get()
+        _shared(Notion).pull.get_database(_tiers_db_id())
+    except Exception as e:
+        _get_logger().warning("Cold start warm-up failed", extra={'error': str(e)})
+
+
+_POOL.submit(_warm_up)
+
+
 @functions_framework.http
 def tiers_card(request: Request) -> Dict[str, Any]:
     """Cloud Function with optimized memory usage."""
+    if request.method == 'OPTIONS':
+        return _CORS_PREFLIGHT_RESPONSE
+
+    # Passed to every manager call; the logger is shared by concurrent requests
     request_id = str(uuid.uuid4())
-    logger = CloudLogger("tiers_card", 'tiers_card').logger
-    logger.request_id = request_id
+    logger = _get_logger()
+    headers = _CORS_HEADERS
+    # Parse the body once; the error handlers reuse it for context
+    body = _parse_body(request)
     
     try:
-        # Handle CORS
-        if request.method == 'OPTIONS':
-            return ('', 204, {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Max-Age': '3600'
-            })
-
-        headers = {'Access-Control-Allow-Origin': '*'}
-        
         # Process request with minimal memory footprint
         manager = TiersCardManager(logger)
-        payload = manager._extract_request_data(request)
+        payload = manager._extract_request_data(body, request.headers.get('X-Request-ID', 'unknown'))
         root = request.headers.get("X-root")
         
-        # Create drive folder only if needed
-        permissions_list = []
-        drive_document = manager.drive.create_folder(payload['Tiers'], root, permissions_list)
-        payload.update(drive_document)
-        
-        # Update Notion and Firestore
-        notion_response = manager.notion_update_tiers(payload)
+        # Create the drive folder if needed, then update Notion and Firestore
+        notion_response = manager.dispatch(payload, root, request_id)
+        # Taken from the Notion response; the Tiers document is never read back
         payload['tiers_notion_id'] = notion_response['id']
-        manager.firestore_add_tiers_card(payload)
 
-        # Send minimal Slack message
+        # Send minimal Slack message before responding, so it is not lost when
+        # the instance is frozen after the response
         manager.send_slack_message(
             payload['request_person'], 
-            f"Tiers folders created for {payload['Tiers']}\n{drive_document['url']}"
+            f"Tiers folders created for {payload['Tiers']}\n{payload['url']}",
+            request_id
         )
         
         return (notion_response, 200, headers)
                     
     except ValueError as e:
-        logger.error("Validation error", extra={'error': str(e)})
+        logger.error("Validation error", extra={'request_id': request_id, 'error': str(e), 'request_data': body})
         return ({'error': str(e)}, 400, headers)
     except Exception as e:
-        logger.error("Unexpected error", extra={'error': str(e)})
+        logger.error("Unexpected error", extra={'request_id': request_id, 'error': str(e), 'request_data': body})
         return ({'error': 'Internal server error'}, 500, headers)
\ No newline at end of file
@@ -1,7 +1,15 @@
 from packages.Tasks import Tasks, TaskConfig
 from packages.Notion import NotionPusher
+import functools
 import uuid
 
+
+@functools.lru_cache(maxsize=1)
+def _pusher() -> NotionPusher:
+    """Shared NotionPusher, so the Notion token is fetched once per instance."""
+    return NotionPusher()
+
+
 class CapsuleNotion:
     """
     A class for creating and managing Notion database entries with customizable properties and icons.
@@ -93,9 +101,9 @@ class CapsuleNotion:
 
     def run(self):
         if self.capsule['payload'].get('page_id'):
-            response =  NotionPusher().push_to_notion(self.capsule['payload']['body'], self.capsule['payload']['page_id'])
+            response =  _pusher().push_to_notion(self.capsule['payload']['body'], self.capsule['payload']['page_id'])
             return response
 
         else:
-            response =  NotionPusher().push_to_notion(self.capsule['payload']['body'])
+            response =  _pusher().push_to_notion(self.capsule['payload']['body'])
             return response
\ No newline at end of file
@@ -1,6 +1,34 @@
 from google.cloud import logging as cloud_logging
 import logging  # Import standard Python logging module
-import json
+import os
+import threading
+
+# Level of every CloudLogger; INFO unless LOG_LEVEL overrides it (e.g. DEBUG)
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+# Cloud Logging client shared by every CloudLogger in the process
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client():
+    """Return the process-wide Cloud Logging client, creating it on first use.
+    
+    Authenticates with Application Default Credentials (the function's runtime
+    service account) and installs the Cloud Logging handler only once, so
+    additional CloudLogger instances neither repeat that work nor attach
+    duplicate handlers to the root logger.
+    
+    Returns:
+        cloud_logging.Client: The shared client
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            client = cloud_logging.Client()
+            client.setup_logging()
+            _CLIENT = client
+        return _CLIENT
 
 
 class CloudLogger(object):
@@ -11,50 +39,48 @@ class CloudLogger(object):
             logger_name (str): Name of the logger
             prefix (str, optional): Prefix to add to all log messages
         """
-        # Set up Google Cloud Logging with credentials
-        self.service_account = 'sa_keys/puppy-logging-key.json'
-        self.cloud_logging_client = cloud_logging.Client.from_service_account_json(self.service_account)
-        self.cloud_logging_client.setup_logging()
+        # Set up Google Cloud Logging with Application Default Credentials
+        self.cloud_logging_client = _get_client()
 
         # Set up Python logger
         self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(LOG_LEVEL)
         
         # Store prefix
         self.prefix = prefix
 
-    def _format_message(self, msg, extra=None):
-        """Format the log message with prefix and extra parameters if provided.
+    def _log(self, level, msg, extra=None, exc_info=False):
+        """Emit a log record with prefix and structured extra parameters if provided.
+        
+        Nothing is formatted when the level is disabled. The extra dict is
+        handed to the Cloud Logging handler as json_fields, which it places in
+        the entry's jsonPayload, so no JSON encoding happens here.
         
         Args:
+            level (int): Standard logging level
             msg (str): The main log message
             extra (dict, optional): Additional parameters to log
-            
-        Returns:
-            str: Formatted log message
+            exc_info (bool, optional): Attach the current exception's traceback
         """
+        if not self.logger.isEnabledFor(level):
+            return
         # Add prefix if set
         if self.prefix:
             msg = f"[{self.prefix}] {msg}"
-           
-        if extra:
-            # Convert extra dict to JSON string and append to message
-            extra_str = json.dumps(extra)
-            return f"{msg} | Extra: {extra_str}"
-        return msg
+        self.logger.log(level, msg, extra={'json_fields': extra} if extra else None, exc_info=exc_info)
 
     def info(self, msg, extra=None):
-        formatted_msg = self._format_message(msg, extra)
-        self.logger.info(formatted_msg)
+        self._log(logging.INFO, msg, extra)
 
     def warning(self, msg, extra=None):
-        formatted_msg = self._format_message(msg, extra)
-        self.logger.warning(formatted_msg)
+        self._log(logging.WARNING, msg, extra)
 
     def error(self, msg, extra=None):
-        formatted_msg = self._format_message(msg, extra)
-        self.logger.error(formatted_msg)
+        self._log(logging.ERROR, msg, extra)
 
     def debug(self, msg, extra=None):
-        formatted_msg = self._format_message(msg, extra)
-        self.logger.debug(formatted_msg)
+        self._log(logging.DEBUG, msg, extra)
+
+    def exception(self, msg, extra=None):
+        """Log an error with the traceback of the exception being handled."""
+        self._log(logging.ERROR, msg, extra, exc_info=True)
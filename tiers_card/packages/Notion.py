@@ -21,12 +21,18 @@ Example:
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 from typing import Dict, List, Union, Any, Optional
 from packages.storage import GCSStorage
 from packages.SecretAccessor import SecretAccessor
 
+# Shared keep-alive session: calls reuse pooled HTTPS connections instead of
+# paying a TLS handshake each, including across warm Cloud Function invocations
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
 class NotionAPI:
     """
     Base class for Notion API operations.
@@ -374,7 +380,7 @@ class NotionPusher(NotionAPI):
             'parent': {'database_id': database_id},
             'properties': properties
         }
-        response = requests.post(
+        response = SESSION.post(
             self.base_url + '/pages',
             headers=self.headers,
             json=body
@@ -385,22 +391,22 @@ class NotionPusher(NotionAPI):
         """Update an existing Notion page."""
         url = f"{self.base_url}/pages/{page_id}"
         body = {'properties': properties}
-        response = requests.patch(url, headers=self.headers, json=body)
+        response = SESSION.patch(url, headers=self.headers, json=body)
         return response.json()
 
     def delete_page(self, page_id: str) -> Dict:
         """Archive (soft delete) a Notion page."""
         url = f"{self.base_url}/pages/{page_id}"
         data = {"archived": True}
-        response = requests.patch(url, headers=self.headers, json=data)
+        response = SESSION.patch(url, headers=self.headers, json=data)
         return response.json()
     
     def push_to_notion(self, body: Dict, page_id: Optional[str] = None) -> requests.Response:
         """Push data to Notion with optional page ID for updates."""
         if page_id is None:
-            return requests.post(self.base_url + '/pages', headers=self.headers, json=body)
+            return SESSION.post(self.base_url + '/pages', headers=self.headers, json=body)
         else:
-            return requests.patch(f"{self.base_url}/pages/{page_id}", headers=self.headers, json=body)
+            return SESSION.patch(f"{self.base_url}/pages/{page_id}", headers=self.headers, json=body)
 
 
 
@@ -426,13 +432,13 @@ class NotionPuller(NotionAPI):
     def get_page(self, page_id: str) -> Dict:
         """Get data for a specific Notion page."""
         url = f"{self.base_url}/pages/{page_id}"
-        response = requests.get(url, headers=self.headers)
+        response = SESSION.get(url, headers=self.headers)
         return response.json()
 
     def get_database(self, database_id: str) -> Dict:
         """Get metadata for a specific Notion database."""
         url = f"{self.base_url}/databases/{database_id}"
-        response = requests.get(url, headers=self.headers)
+        response = SESSION.get(url, headers=self.headers)
         return response.json()
 
     def query_database(self, database_id: str, filter: Optional[Dict] = None) -> Dict:
@@ -457,7 +463,7 @@ class NotionPuller(NotionAPI):
             if next_cursor:
                 body['start_cursor'] = next_cursor
                 
-            response = requests.post(url, headers=self.headers, json=body)
+            response = SESSION.post(url, headers=self.headers, json=body)
             try:
                 response.get('results')
                 all_results.extend(response['results'])
@@ -483,7 +489,7 @@ class NotionPuller(NotionAPI):
             return results
 
         def request_records(url: str, json_data: Optional[Dict] = None) -> tuple:
-            response = requests.post(url, headers=self.headers, json=json_data)
+            response = SESSION.post(url, headers=self.headers, json=json_data)
             data = response.json()
             has_more = data.get('has_more')
             next_cursor = data.get('next_cursor')
@@ -23,6 +23,7 @@ Example:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from google.cloud import secretmanager
 import logging
 from typing import Dict, List, Optional, Any
@@ -31,6 +32,11 @@ import json
 import packages.Notion as Notion
 from packages.SecretAccessor import SecretAccessor
 
+# Shared keep-alive session: calls reuse pooled HTTPS connections instead of
+# paying a TLS handshake each, including across warm Cloud Function invocations
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -74,7 +80,7 @@ class SlackAPI:
     
     def get_usergroups(self) -> Dict[str, str]:
         """Fetch usergroups from Slack API"""
-        response = requests.get(
+        response = SESSION.get(
             f"{SlackConfig.BASE_API_URL}/usergroups.list",
             headers=self.headers
         )
@@ -92,7 +98,7 @@ class SlackAPI:
         # Get channel ID from channel name if it exists in the lookup dictionary
         channel_id = SlackConfig.CHANNEL.get(channel, channel)
         
-        response = requests.post(
+        response = SESSION.post(
             f"{SlackConfig.BASE_API_URL}/chat.postMessage",
             headers=self.headers,
             json={"channel": channel_id, "text": text}
@@ -114,7 +120,7 @@ class SlackAPI:
             bool: True if message was sent successfully, False otherwise
         """
         # First, open a direct message conversation
-        response = requests.post(
+        response = SESSION.post(
             f"{SlackConfig.BASE_API_URL}/conversations.open",
             headers=self.headers,
             json={"users": user_id}
@@ -252,7 +258,7 @@ def send_message(channel: str, message: str) -> bool:
 def send_webhook(webhook_url: str, message: str) -> bool:
     """Send a message via webhook"""
     try:
-        response = requests.post(
+        response = SESSION.post(
             webhook_url, 
             json={"text": message},
             timeout=5
@@ -281,7 +287,7 @@ def send_slack_webhook(webhook_url: str, message: str):
     """
     payload = {"text": message}
     try:
-        response = requests.post(webhook_url, json=payload, timeout=5)
+        response = SESSION.post(webhook_url, json=payload, timeout=5)
         if response.status_code != 200:
             logger.error(f"Slack webhook failed: {response.status_code} - {response.text}")
         else:
@@ -311,7 +317,7 @@ def send_slack_api_message(channel: str, message: str, secret_id: str):
     payload = {"channel": channel, "text": message}
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=5)
+        response = SESSION.post(url, json=payload, headers=headers, timeout=5)
         resp_data = response.json()
         if not resp_data.get("ok"):
             logger.error(f"Slack API error: {resp_data.get('error')}")
@@ -338,7 +344,7 @@ def get_groups():
     
     SLACK_BOT_TOKEN = SecretAccessor().get_secret("SLACK_Puppy")
 
-    response = requests.get(
+    response = SESSION.get(
         "https://slack.com/api/usergroups.list",
         headers={"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
     )
@@ -392,7 +398,7 @@ def get_slack_person_id(email):
                 'email': email
             }
     # Make the request
-    response = requests.get(url, headers=headers, params=payload)
+    response = SESSION.get(url, headers=headers, params=payload)
     # Parse the response
     data = response.json()
     if data['ok']:
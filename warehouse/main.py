@@ -1,6 +1,6 @@
 from typing import Dict, Any, Optional
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from packages.Logging import CloudLogger
 from packages.Notion import Notion
 
@@ -17,6 +17,8 @@ def process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: The processed response
     """
+    # One timestamp per invocation, shared by the response and its metadata
+    timestamp = datetime.now(timezone.utc).isoformat()
     try:
         # TODO: Add your payload processing logic here
         logger.info(f"Processing payload: {payload}")
@@ -24,11 +26,11 @@ def process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
         # Example response structure
         response = {
             "status": "success",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "processed_data": payload.get("data", {}),
             "metadata": {
                 "version": "1.0",
-                "processing_time": datetime.utcnow().isoformat()
+                "processing_time": timestamp
             }
         }
         
@@ -39,7 +41,7 @@ def process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
 
 def main(request: Dict[str, Any]) -> Dict[str, Any]:
@@ -67,7 +69,7 @@ def main(request: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
 # For local testing
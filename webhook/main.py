@@ -13,10 +13,21 @@ The function supports different types of webhook payloads:
 Structured logs are emitted using CloudLogger.
 """
 
-from flask import Request, jsonify
+import json
+import logging
+from flask import Request
 from packages.Logging import CloudLogger
 from packages.Action import process_simple_direct_message
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), default=str).encode()
+
 # Initialize structured Cloud Logging
 logger = CloudLogger("webhook")
 
@@ -25,6 +36,10 @@ HANDLERS = {
     "direct_message": process_simple_direct_message,
 }
 
+# JSON responses are serialized directly instead of through flask.jsonify,
+# which looks up app config on every call
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 # ——— Cloud Function Entry Point —————————————————————————————————————————
 def webhook(request: Request):
     """
@@ -50,8 +65,10 @@ def webhook(request: Request):
     try:
         payload = request.get_json(force=True)
         custom_header = request.headers.get("X-database")
-        logger.debug(f"[webhook] Parsed JSON: {payload}")
-        logger.debug(f"[webhook] header catched JSON: {custom_header}")
+        # Formatting the whole payload is skipped unless DEBUG is enabled
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[webhook] Parsed JSON: {payload}")
+            logger.debug(f"[webhook] header catched JSON: {custom_header}")
     except Exception as e:
         logger.error(f"[webhook] Failed to parse JSON: {e}")
         return "Invalid JSON", 400
@@ -72,11 +89,11 @@ def webhook(request: Request):
 
     except Exception as e:
         logger.error(f"[webhook] Handler error for target '{target}': {e}")
-        return jsonify({"error": str(e)}), 500
+        return _dumps({"error": str(e)}), 500, _JSON_HEADERS
 
     logger.info(f"[webhook] Successfully processed target '{target}'")
-    return jsonify({
+    return _dumps({
         "status": "ok",
         "target": target,
         "result": result,
-    }), 200
\ No newline at end of file
+    }), 200, _JSON_HEADERS
\ No newline at end of file
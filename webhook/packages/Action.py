@@ -1,8 +1,15 @@
+import functools
+import logging
+import threading
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from datetime import datetime
 from packages.Logging import CloudLogger
 from packages.Notion import Notion
+from packages.NotionCache import cached_query
 from packages.Tasks import Tasks
 from packages.Slack import SlackMessageBuilder, send_direct_message, SlackCache
 from web3 import Web3
@@ -11,6 +18,80 @@ import json
 # Initialize logger with structured logging
 logger = CloudLogger("webhook")
 
+# Keep-alive session for calls to other Cloud Functions, kept at module scope
+# so warm instances reuse the pooled connections instead of new TLS handshakes
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
+# The only contract properties process_balance_of reads
+TOKEN_LIST_PROPERTIES = ('Name', 'Type', 'Network', 'Address')
+
+# People directory reused across warm invocations; refreshed after PEOPLE_TTL
+# seconds instead of building a SlackCache (and its API clients) per message
+PEOPLE_TTL = 600
+# The last good directory is kept indefinitely and served when a refresh fails;
+# "stale_served" counts how often that happened on this instance
+_PEOPLE_CACHE = {"t": 0.0, "data": None, "by_notion": {}, "stale_served": 0}
+# Held while the directory reloads, so concurrent messages share one fetch
+_PEOPLE_LOCK = threading.Lock()
+
+
+def _people():
+    """Return the Slack/Notion people directory, reloading it once it is stale.
+
+    If the reload fails and a previous directory exists, that directory is
+    returned instead and a warning is logged. Concurrent callers that find the
+    directory stale wait for a single reload.
+    """
+    if _PEOPLE_CACHE["data"] is not None and time.monotonic() - _PEOPLE_CACHE["t"] <= PEOPLE_TTL:
+        return _PEOPLE_CACHE["data"]
+    with _PEOPLE_LOCK:
+        # Re-check: another caller may have reloaded while this one waited
+        now = time.monotonic()
+        if _PEOPLE_CACHE["data"] is not None and now - _PEOPLE_CACHE["t"] <= PEOPLE_TTL:
+            return _PEOPLE_CACHE["data"]
+        try:
+            data = SlackCache().get_people()
+        except Exception as e:
+            if _PEOPLE_CACHE["data"] is None:
+                raise
+            _PEOPLE_CACHE["stale_served"] += 1
+            logger.warning(f"[_people] Refresh failed, serving directory from {now - _PEOPLE_CACHE['t']:.0f}s ago "
+                           f"(stale served {_PEOPLE_CACHE['stale_served']} times): {e}")
+            return _PEOPLE_CACHE["data"]
+        # Index by Notion ID once per refresh, so lookups don't scan the list
+        by_notion = {p['Notion ID']: p for p in data or () if p.get('Notion ID')}
+        _PEOPLE_CACHE.update(t=now, data=data, by_notion=by_notion)
+        return data
+
+
+def _person_by_notion_id(notion_id):
+    """Return the directory entry of a Notion user, None if unknown."""
+    _people()
+    return _PEOPLE_CACHE["by_notion"].get(notion_id)
+
+
+def _row_ok(c: dict) -> bool:
+    """Whether a token_list page has a Name, Type, Network and Address to read."""
+    props = c.get('properties') or {}
+    return bool(
+        (props.get('Name') or {}).get('title')
+        and (props.get('Type') or {}).get('select')
+        and (props.get('Network') or {}).get('select')
+        and (props.get('Address') or {}).get('rich_text')
+    )
+
+
+@functools.lru_cache(maxsize=100_000)
+def _checksum(address: str) -> str:
+    """EIP-55 checksum of a lowercased address, memoized across invocations."""
+    return Web3.to_checksum_address(address)
+
+
 def log_execution_time(func):
     """Decorator to log function execution time."""
     def wrapper(*args, **kwargs):
@@ -49,7 +130,7 @@ def process_purple_gold(payload: dict) -> dict:
     worker_url = "https://europe-west1-digital-africa-rainbow.cloudfunctions.net/purple_gold"
     try:
         logger.debug(f"[process_purple_gold] Sending request to {worker_url}")
-        response = requests.post(worker_url, json=payload)
+        response = _SESSION.post(worker_url, json=payload, timeout=(3, 30))
         response.raise_for_status()
         
         execution_time = time.time() - start_time
@@ -85,32 +166,45 @@ def process_balance_of(payload: dict) -> dict:
     
     try:
         data = payload['data']
-        params = {'database': 'CONTRACTS', 'query': 'token_list'}
+        params = {'database': 'CONTRACTS', 'query': 'token_list', 'filter_properties': TOKEN_LIST_PROPERTIES}
         logger.debug(f"[process_balance_of] Fetching data from Notion with params: {params}")
         
-        data = Notion.Query(**params).run()
+        data = cached_query(**params)
         reader = Notion.reader
-        tasks_created = 0
+        tasks = []
+        skipped = []
         
         for c in data:
+            # Incomplete rows are skipped by checking, not by catching KeyError/IndexError
+            if not _row_ok(c):
+                skipped.append(c.get('id', 'unknown'))
+                continue
+            properties = c['properties']
             try:
-                line = {
-                    'page_id': c['id'],
-                    'Name': reader.title(c['properties']['Name']),
-                    'Type': reader.select(c['properties']['Type']),
-                    'Network': reader.select(c['properties']['Network']),
-                    'Address': Web3.to_checksum_address(reader.text(c['properties']['Address']))
-                }
-                task = {
-                    'url': 'https://europe-west1-digital-africa-rainbow.cloudfunctions.net/balance_of',
-                    'payload': line
-                }
-                Tasks().add_task(task)
-                tasks_created += 1
-                logger.debug(f"[process_balance_of] Created task for {line['Name']}")
-            except Exception as e:
-                logger.error(f"[process_balance_of] Failed to process contract {c.get('id', 'unknown')}: {str(e)}")
+                address = _checksum(reader.text(properties['Address']).lower())
+            except ValueError as e:
+                logger.error(f"[process_balance_of] Invalid address for contract {c['id']}: {str(e)}")
                 continue
+            line = {
+                'page_id': c['id'],
+                'Name': reader.title(properties['Name']),
+                'Type': reader.select(properties['Type']),
+                'Network': reader.select(properties['Network']),
+                'Address': address
+            }
+            tasks.append({
+                'url': 'https://europe-west1-digital-africa-rainbow.cloudfunctions.net/balance_of',
+                'payload': line
+            })
+        
+        if skipped:
+            logger.error(f"[process_balance_of] Skipped {len(skipped)} incomplete contracts: {skipped}")
+        
+        # Enqueue every contract in one concurrent batch
+        results = Tasks.get().add_tasks_batch(tasks)
+        tasks_created = len(results["succeeded"])
+        for failure in results["failed"]:
+            logger.error(f"[process_balance_of] Failed to create task for {failure['params']['payload']['Name']}: {failure['error']}")
         
         execution_time = time.time() - start_time
         logger.info(f"[process_balance_of] Successfully created {tasks_created} tasks in {execution_time:.2f}s")
@@ -136,7 +230,7 @@ def process_simple_direct_message(payload: dict) -> dict:
 
     Returns:
         dict: Processing result containing:
-            - status: Success/failure status
+            - status: Success/failure status, or "skipped" for an empty message
             - execution_time: Time taken to process
             - message_sent: Whether the message was sent successfully
             - error: Error message if any
@@ -146,7 +240,8 @@ def process_simple_direct_message(payload: dict) -> dict:
     
     try:
         # Log the full payload structure for debugging
-        logger.debug(f"[process_simple_direct_message] Full payload structure: {json.dumps(payload, indent=2)}")
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[process_simple_direct_message] Full payload structure: {json.dumps(payload)}")
         
         # Extract data from Notion payload
         data = payload.get('data', {})
@@ -154,14 +249,40 @@ def process_simple_direct_message(payload: dict) -> dict:
             raise ValueError("No data found in payload")
             
         # Log the data structure
-        logger.debug(f"[process_simple_direct_message] Data structure: {json.dumps(data, indent=2)}")
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[process_simple_direct_message] Data structure: {json.dumps(data)}")
         
         properties = data.get('properties', {})
         if not properties:
             raise ValueError("No properties found in data")
             
         # Log the properties structure
-        logger.debug(f"[process_simple_direct_message] Properties structure: {json.dumps(properties, indent=2)}")
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[process_simple_direct_message] Properties structure: {json.dumps(properties)}")
+        
+        # Extract message first: empty messages are common and need no person lookup
+        message_prop = properties.get('Message', {})
+        if not message_prop:
+            raise ValueError("No 'Message' field found in properties")
+        
+        formula = message_prop.get('formula')
+        if formula is not None:
+            message = formula.get('string')
+        else:
+            rich_text = message_prop.get('rich_text') or []
+            message = rich_text[0]['text']['content'] if rich_text else None
+
+        if not message:
+            execution_time = time.time() - start_time
+            logger.info(f"[process_simple_direct_message] Empty message, skipped in {execution_time:.2f}s")
+            return {
+                "status": "skipped",
+                "execution_time": execution_time,
+                "message_sent": False,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+            
+        logger.debug(f"[process_simple_direct_message] Extracted message: {message}")
         
         # Extract person information
         asked_by = properties.get('Asked by', {})
@@ -179,15 +300,15 @@ def process_simple_direct_message(payload: dict) -> dict:
         logger.debug(f"[process_simple_direct_message] Found Notion ID: {notion_id}")
         
         # Get Slack ID from cache
-        slack_cache = SlackCache()
-        people = slack_cache.get_people()
+        people = _people()
         if not people:
             raise ValueError("No people found in Slack cache")
             
         # Log the people cache for debugging
-        logger.debug(f"[process_simple_direct_message] People cache: {json.dumps(people, indent=2)}")
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[process_simple_direct_message] People cache: {json.dumps(people)}")
         
-        person = next((p for p in people if p.get('Notion ID') == notion_id), None)
+        person = _person_by_notion_id(notion_id)
         if not person:
             raise ValueError(f"No matching person found for Notion ID: {notion_id}")
             
@@ -197,25 +318,6 @@ def process_simple_direct_message(payload: dict) -> dict:
             
         logger.debug(f"[process_simple_direct_message] Found Slack ID: {slack_id}")
         
-        # Extract message
-        message_prop = properties.get('Message', {})
-        if not message_prop:
-            raise ValueError("No 'Message' field found in properties")
-        
-        try:
-            formula = message_prop.get('formula')
-            #if not formula:
-            #    raise ValueError("No formula found in Message field")
-            message = formula.get('string')
-        except Exception as e:
-            formula = message_prop.get('rich_text')
-            message = formula[0]['text']['content']
-
-        if not message:
-            raise ValueError("No message found in formula")
-            
-        logger.debug(f"[process_simple_direct_message] Extracted message: {message}")
-        
         # Get URL
         url = data.get('url')
         if not url:
@@ -254,8 +356,8 @@ def process_simple_direct_message(payload: dict) -> dict:
         error_msg = f"[process_simple_direct_message] Failed after {execution_time:.2f}s: {str(e)}"
         logger.error(error_msg)
         # Log the full traceback for debugging
-        import traceback
-        logger.error(f"[process_simple_direct_message] Traceback: {traceback.format_exc()}")
+        tb = traceback.format_exc()
+        logger.error(f"[process_simple_direct_message] Traceback: {tb}")
         return {
             "status": "error",
             "execution_time": execution_time,
@@ -264,7 +366,7 @@ def process_simple_direct_message(payload: dict) -> dict:
             "error_details": {
                 "type": type(e).__name__,
                 "message": str(e),
-                "traceback": traceback.format_exc()
+                "traceback": tb
             },
             "timestamp": datetime.utcnow().isoformat()
         }
@@ -1,17 +1,60 @@
 from google.cloud import logging as cloud_logging
+from google.cloud.logging.handlers import setup_logging
+import atexit
 import logging  # Import standard Python logging module
+from logging.handlers import QueueHandler, QueueListener
+import os
+import queue
+import threading
+
+# Level of every CloudLogger; INFO unless LOG_LEVEL overrides it (e.g. DEBUG)
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+# Cloud Logging client shared by every CloudLogger in the process
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+# Background thread handing queued records to the Cloud Logging handler
+_LISTENER = None
+
+
+def _get_client():
+    """Return the process-wide Cloud Logging client, creating it on first use.
+    
+    Authenticates with Application Default Credentials (the function's runtime
+    service account) and installs the Cloud Logging handler only once, so
+    additional CloudLogger instances neither repeat that work nor attach
+    duplicate handlers to the root logger.
+    
+    The root logger only gets a QueueHandler, so a log call just enqueues
+    the record. A QueueListener thread passes the records to the client's
+    default handler, off the request path, and drains the queue on exit.
+    
+    Returns:
+        cloud_logging.Client: The shared client
+    """
+    global _CLIENT, _LISTENER
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            client = cloud_logging.Client()
+            log_queue = queue.Queue(-1)
+            _LISTENER = QueueListener(log_queue, client.get_default_handler(),
+                                      respect_handler_level=True)
+            _LISTENER.start()
+            atexit.register(_LISTENER.stop)
+            setup_logging(QueueHandler(log_queue))
+            _CLIENT = client
+        return _CLIENT
 
 
 class CloudLogger(object):
     def __init__(self, logger_name):
-        # Set up Google Cloud Logging with credentials
-        self.service_account = 'sa_keys/puppy-logging-key.json'
-        self.cloud_logging_client = cloud_logging.Client.from_service_account_json(self.service_account)
-        self.cloud_logging_client.setup_logging()
+        # Set up Google Cloud Logging with Application Default Credentials
+        self.cloud_logging_client = _get_client()
 
         # Set up Python logger
         self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(LOG_LEVEL)
 
     def info(self, msg):
         self.logger.info(msg)
@@ -23,4 +66,5 @@ class CloudLogger(object):
         self.logger.error(msg)
 
     def debug(self, msg):
-        self.logger.debug(msg)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg)
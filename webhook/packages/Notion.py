@@ -73,14 +73,22 @@ class Context:
         return database_ids
 
 
+# Property ids of each database by property name, resolved once per instance
+_PROPERTY_IDS: Dict[str, Dict[str, str]] = {}
+
+
 class Query:
     """
     Query class for querying the database.
+
+    When filter_properties names some properties, Notion returns only those
+    properties on each page.
     """
-    def __init__(self,database, query):
+    def __init__(self,database, query, filter_properties: Optional[List[str]] = None):
         self.context = Context()
         self.database = database
         self.query = query
+        self.filter_properties = filter_properties
         self.query_lib = self.get_query_lib()
         
     def get_query_lib(self):
@@ -117,7 +125,15 @@ class Query:
         Run a query on the database.
         """
         databases = Context().get_database_ids()        
-        query = Notion().pull.query_database(databases[self.database],self.query_lib[self.query])
+        database_id = databases[self.database]
+        pull = Notion().pull
+        property_ids = None
+        if self.filter_properties:
+            # filter_properties takes property ids, not names
+            if database_id not in _PROPERTY_IDS:
+                _PROPERTY_IDS[database_id] = {name: prop_id for prop_id, name in pull.bindings(database_id).items()}
+            property_ids = [_PROPERTY_IDS[database_id][name] for name in self.filter_properties]
+        query = pull.query_database(database_id, self.query_lib[self.query], filter_properties=property_ids)
         return query['results']
 
 
@@ -371,19 +387,23 @@ class NotionPuller(NotionAPI):
         response = requests.get(url, headers=self.headers)
         return response.json()
 
-    def query_database(self, database_id: str, filter: Optional[Dict] = None) -> Dict:
+    def query_database(self, database_id: str, filter: Optional[Dict] = None,
+                       filter_properties: Optional[List[str]] = None) -> Dict:
         """
         Query a Notion database with optional filters and full pagination support.
         
         Args:
             database_id (str): The ID of the database to query
             filter (Optional[Dict]): Optional filter criteria
+            filter_properties (Optional[List[str]]): Ids of the only properties
+                to return on each page, shrinking the responses
             
         Returns:
             Dict: Complete query results including all pages
         """
         url = f'{self.base_url}/databases/{database_id}/query'
         body = {'filter': filter} if filter else {}
+        params = [('filter_properties', prop_id) for prop_id in filter_properties or ()]
         
         all_results = []
         has_more = True
@@ -393,7 +413,7 @@ class NotionPuller(NotionAPI):
             if next_cursor:
                 body['start_cursor'] = next_cursor
                 
-            response = requests.post(url, headers=self.headers, json=body)
+            response = requests.post(url, headers=self.headers, json=body, params=params)
             data = response.json()
             all_results.extend(data['results'])
             has_more = data.get('has_more', False)
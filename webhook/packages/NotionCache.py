@@ -0,0 +1,83 @@
+"""
+In-process cache for named Notion database queries.
+
+Query results are kept per warm Cloud Function instance, so repeated
+invocations reuse them instead of paging through the Notion API again.
+
+Example:
+    >>> contracts = cached_query('CONTRACTS', 'token_list')
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from packages.Logging import CloudLogger
+from packages.Notion import Query
+
+logger = CloudLogger("NotionCache")
+
+# Seconds a query result is served from memory before Notion is asked again
+DEFAULT_TTL = 300
+
+# Results by (database, query, filter_properties), as (fetched_at, results)
+_CACHE: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[float, List[Dict]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# One lock per key, held while its query runs, so concurrent misses on the
+# same query wait for a single Notion fetch instead of each issuing their own
+_REFRESH_LOCKS: Dict[Tuple[str, str, Tuple[str, ...]], threading.Lock] = {}
+
+# Times a stale result was served because Notion could not be reached
+stale_served = 0
+
+
+def cached_query(database: str, query: str, filter_properties: Optional[Sequence[str]] = None,
+                 ttl: float = DEFAULT_TTL) -> List[Dict]:
+    """Run a named Notion query, reusing a result younger than ``ttl`` seconds.
+
+    Results are kept past their ``ttl``: when a refresh fails, the last
+    good result is returned and a warning is logged. The error is raised
+    only when there is no earlier result to fall back on. Callers that miss
+    on the same query at the same time share one fetch.
+
+    Args:
+        database (str): Database key known to Notion's Context (e.g. 'CONTRACTS')
+        query (str): Name of the query in Query's library (e.g. 'token_list')
+        filter_properties (Sequence[str], optional): Names of the only
+            properties to fetch on each page
+        ttl (float, optional): Maximum age of a cached result in seconds
+
+    Returns:
+        List[Dict]: Pages returned by the query; shared between callers, so
+            treat them as read-only
+    """
+    key = (database, query, tuple(filter_properties or ()))
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        refresh_lock = _REFRESH_LOCKS.setdefault(key, threading.Lock())
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    global stale_served
+    with refresh_lock:
+        # Another caller may have refreshed the entry while this one waited
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        try:
+            results = Query(database=database, query=query,
+                            filter_properties=list(filter_properties) if filter_properties else None).run()
+        except Exception as e:
+            if cached is None:
+                raise
+            with _CACHE_LOCK:
+                stale_served += 1
+            logger.warning(f"[cached_query] {database}/{query} refresh failed, serving result from "
+                           f"{time.monotonic() - cached[0]:.0f}s ago (stale served {stale_served} times): {e}")
+            return cached[1]
+        with _CACHE_LOCK:
+            _CACHE[key] = (time.monotonic(), results)
+        return results
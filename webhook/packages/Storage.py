@@ -2,12 +2,20 @@
 Google Cloud Storage primitive for accessing files.
 """
 from google.cloud import storage
+from google.api_core.exceptions import NotFound, PreconditionFailed
 import os
-from typing import Optional, Union, BinaryIO
+from typing import Iterator, Optional, Union, BinaryIO
 from packages.Logging import CloudLogger
 
 logger = CloudLogger("storage")
 
+# Bytes sent per request when streaming file objects (a multiple of 256 KiB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Listings fetch only blob names, a page of LIST_PAGE_SIZE names at a time
+LIST_FIELDS = "items(name),nextPageToken"
+LIST_PAGE_SIZE = 1000
+
 class Storage:
     def __init__(self, bucket_name: str):
         """
@@ -34,43 +42,58 @@ class Storage:
         try:
             logger.debug(f"[Storage] Reading file: {file_path}")
             blob = self.bucket.blob(file_path)
-            
-            if not blob.exists():
-                logger.warning(f"[Storage] File not found: {file_path}")
-                return None
-                
             content = blob.download_as_bytes()
             logger.info(f"[Storage] Successfully read file: {file_path}")
             return content
             
+        except NotFound:
+            logger.warning(f"[Storage] File not found: {file_path}")
+            return None
         except Exception as e:
             logger.error(f"[Storage] Error reading file {file_path}: {str(e)}")
             raise
 
-    def write_file(self, file_path: str, content: Union[bytes, str, BinaryIO]) -> bool:
+    def write_file(self, file_path: str, content: Union[bytes, str, BinaryIO],
+                   content_type: Optional[str] = None, overwrite: bool = True) -> bool:
         """
         Write a file to Google Cloud Storage.
 
+        File objects are streamed from their current position in chunks
+        rather than read into memory first. With ``overwrite=False`` the
+        upload is conditional on the file not existing yet, checked by GCS in
+        the same request rather than by a separate existence probe.
+
         Args:
             file_path (str): The path to write the file to in the bucket
             content (Union[bytes, str, BinaryIO]): The content to write
+            content_type (Optional[str]): MIME type to store with the file
+            overwrite (bool): Replace the file if it already exists
 
         Returns:
             bool: True if the write was successful, False otherwise
+                (including when the file exists and overwrite is False)
         """
         try:
             logger.debug(f"[Storage] Writing file: {file_path}")
             blob = self.bucket.blob(file_path)
+            # Generation 0 only matches an object that does not exist yet
+            if_generation_match = None if overwrite else 0
             
-            if isinstance(content, str):
-                content = content.encode('utf-8')
-            elif isinstance(content, BinaryIO):
-                content = content.read()
-                
-            blob.upload_from_string(content)
+            if hasattr(content, 'read'):
+                blob.chunk_size = UPLOAD_CHUNK_SIZE
+                blob.upload_from_file(content, content_type=content_type,
+                                      if_generation_match=if_generation_match)
+            else:
+                if isinstance(content, str):
+                    content = content.encode('utf-8')
+                blob.upload_from_string(content, content_type=content_type,
+                                        if_generation_match=if_generation_match)
             logger.info(f"[Storage] Successfully wrote file: {file_path}")
             return True
             
+        except PreconditionFailed:
+            logger.info(f"[Storage] File already exists, not overwritten: {file_path}")
+            return False
         except Exception as e:
             logger.error(f"[Storage] Error writing file {file_path}: {str(e)}")
             return False
@@ -88,19 +111,33 @@ class Storage:
         try:
             logger.debug(f"[Storage] Deleting file: {file_path}")
             blob = self.bucket.blob(file_path)
-            
-            if not blob.exists():
-                logger.warning(f"[Storage] File not found for deletion: {file_path}")
-                return False
-                
             blob.delete()
             logger.info(f"[Storage] Successfully deleted file: {file_path}")
             return True
             
+        except NotFound:
+            logger.warning(f"[Storage] File not found for deletion: {file_path}")
+            return False
         except Exception as e:
             logger.error(f"[Storage] Error deleting file {file_path}: {str(e)}")
             return False
 
+    def iter_files(self, prefix: str = "") -> Iterator[str]:
+        """
+        Lazily iterate over the files in the bucket with an optional prefix.
+
+        Listing responses are projected to names only, and pages are fetched
+        as the iterator is consumed.
+
+        Args:
+            prefix (str): Optional prefix to filter files
+
+        Yields:
+            str: File paths
+        """
+        for blob in self.bucket.list_blobs(prefix=prefix, fields=LIST_FIELDS, page_size=LIST_PAGE_SIZE):
+            yield blob.name
+
     def list_files(self, prefix: str = "") -> list:
         """
         List files in the bucket with an optional prefix.
@@ -113,8 +150,7 @@ class Storage:
         """
         try:
             logger.debug(f"[Storage] Listing files with prefix: {prefix}")
-            blobs = self.bucket.list_blobs(prefix=prefix)
-            files = [blob.name for blob in blobs]
+            files = list(self.iter_files(prefix))
             logger.info(f"[Storage] Found {len(files)} files with prefix: {prefix}")
             return files
             
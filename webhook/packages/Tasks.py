@@ -1,10 +1,40 @@
 import json
 from google.cloud import tasks_v2
+from google.cloud.tasks_v2.services.cloud_tasks.transports import CloudTasksGrpcTransport
 from google.oauth2 import service_account
 from packages.Logging import CloudLogger
 from typing import Dict, Optional, Union, List
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# gRPC channel options: the transport's unlimited message sizes, plus keepalive
+# pings so the HTTP/2 connection to Cloud Tasks survives idle gaps between
+# invocations instead of being re-established (TCP + TLS) on the next task
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# Concurrent create_task calls in add_tasks_batch
+BATCH_MAX_WORKERS = 32
+
+# Worker threads shared by every batch; started on demand and kept across warm invocations
+_BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS, thread_name_prefix="tasks-batch")
 
 @dataclass
 class TaskConfig:
@@ -33,6 +63,24 @@ class Tasks(object):
         logging (CloudLogger): Logger instance
     """
     
+    _INSTANCE: Optional["Tasks"] = None
+    _INSTANCE_LOCK = threading.Lock()
+    
+    @classmethod
+    def get(cls) -> "Tasks":
+        """Return the process-wide Tasks client with the default configuration.
+        
+        The service account key is read and the gRPC channel opened once, then
+        reused by every caller, including across warm invocations.
+        
+        Returns:
+            Tasks: The shared instance
+        """
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
+            return cls._INSTANCE
+    
     def __init__(self, config: Optional[TaskConfig] = None):
         """Initialize Tasks client.
         
@@ -61,12 +109,18 @@ class Tasks(object):
         )
     
     def _initialize_client(self) -> None:
-        """Initialize the Cloud Tasks client."""
+        """Initialize the Cloud Tasks client on a keepalive gRPC channel."""
         try:
             credentials = service_account.Credentials.from_service_account_file(
                 self.config.service_account_file
             )
-            self.client = tasks_v2.CloudTasksClient(credentials=credentials)
+            channel = CloudTasksGrpcTransport.create_channel(
+                credentials=credentials,
+                options=GRPC_CHANNEL_OPTIONS
+            )
+            self.client = tasks_v2.CloudTasksClient(
+                transport=CloudTasksGrpcTransport(channel=channel)
+            )
         except Exception as e:
             self.logging.error(f"Failed to initialize client: {e}")
             raise
@@ -105,7 +159,7 @@ class Tasks(object):
                     "http_method": tasks_v2.HttpMethod.POST,
                     "url": url,
                     "headers": {"Content-Type": "application/json"},
-                    "body": json.dumps(payload).encode()
+                    "body": _dumps(payload)
                 }
             }
             
@@ -114,17 +168,18 @@ class Tasks(object):
             )
             
             self.logging.info(f"[enqueue_push_notion_task] Task enqueued: {response.name}")
-            print(f"[enqueue_push_notion_task] Task enqueued: {response.name}")
             return response
             
         except Exception as e:
-            print(f"{e}")
             self.logging.error(f"{e}")
             return None
     
     def add_tasks_batch(self, tasks: List[Dict]) -> Dict[str, List]:
         """Add multiple tasks in batch.
         
+        Tasks are created concurrently on a process-wide thread pool, at most
+        BATCH_MAX_WORKERS at a time, sharing this client.
+        
         Args:
             tasks (List[Dict]): List of task parameters, each containing:
                 - url (str): Target URL for the task (required)
@@ -136,9 +191,15 @@ class Tasks(object):
         """
         results = {"succeeded": [], "failed": []}
         
-        for task_params in tasks:
+        # Overlap the Cloud Tasks round trips; results are read back in input order
+        futures = [
+            (task_params, _BATCH_EXECUTOR.submit(self.add_task, task_params))
+            for task_params in tasks
+        ]
+        
+        for task_params, future in futures:
             try:
-                task_name = self.add_task(task_params)
+                task_name = future.result()
                 if task_name:
                     results["succeeded"].append({
                         "params": task_params,
@@ -0,0 +1,20 @@
+"""
+Tests for the JSON response serialization of the webhook function.
+
+Run from this directory with: python -m pytest test_main.py
+"""
+
+import json
+from decimal import Decimal
+
+from main import _dumps
+
+
+def test_dumps_non_string_keys():
+    """Non-string keys are stringified, as flask.jsonify did."""
+    assert json.loads(_dumps({1: 'a', 'b': 2})) == {'1': 'a', 'b': 2}
+
+
+def test_dumps_unserializable_values():
+    """Values without a JSON form fall back to str()."""
+    assert json.loads(_dumps({'price': Decimal('1.50')})) == {'price': '1.50'}